@@ -1,12 +1,49 @@
 import heapq
+import time
 import numpy as np
 from collections import deque
 
+from distance_table import load_distance_table
+
+BITS_PER_TILE = 4  # enough for tiles 0-15 (8- and 15-puzzle)
+TILE_MASK = (1 << BITS_PER_TILE) - 1
+
+OPPOSITE_MOVES = {'up': 'down', 'down': 'up', 'left': 'right', 'right': 'left'}
+# Move names as single letters, the format used by prac2 and solution_cache
+MOVE_LETTERS = {'up': 'U', 'down': 'D', 'left': 'L', 'right': 'R'}
+MOVE_NAMES = {letter: name for name, letter in MOVE_LETTERS.items()}
+# Marks a queued node that stands for a cached path to the goal
+CACHED_MOVE = 'cached'
+
+def tile_bits(size):
+    """Number of bits needed per tile on a size x size board."""
+    return max(BITS_PER_TILE, (size * size - 1).bit_length())
+
+def pack_state(state, bits=BITS_PER_TILE):
+    """Pack a board into a single integer, bits per tile in row-major order."""
+    packed = 0
+    for i, tile in enumerate(np.asarray(state).flatten()):
+        packed |= int(tile) << (bits * i)
+    return packed
+
+def unpack_state(packed, size=3, bits=BITS_PER_TILE):
+    """Unpack an integer produced by pack_state back into a size x size array."""
+    mask = (1 << bits) - 1
+    tiles = [(packed >> (bits * i)) & mask for i in range(size * size)]
+    return np.array(tiles).reshape(size, size)
+
+def goal_board(size):
+    """Goal board for a size x size puzzle: tiles in order, blank last."""
+    return np.append(np.arange(1, size * size), 0).reshape(size, size)
+
 class PuzzleNode:
-    """Node class for 8-puzzle problem."""
+    """Node class for the sliding-puzzle problem."""
     
-    def __init__(self, state, parent=None, move=None, depth=0, cost=0, heuristic=0):
-        self.state = state  # 3x3 numpy array representing the puzzle
+    __slots__ = ('state', 'blank', 'parent', 'move', 'depth', 'cost', 'heuristic', 'f')
+    
+    def __init__(self, state, blank, parent=None, move=None, depth=0, cost=0, heuristic=0):
+        self.state = state  # packed integer representing the puzzle (see pack_state)
+        self.blank = blank  # flat index of the blank tile
         self.parent = parent  # parent node
         self.move = move  # move that led to this state
         self.depth = depth  # depth in the search tree
@@ -22,17 +59,25 @@ class PuzzleNode:
         """Check if two states are equal."""
         if other is None:
             return False
-        return np.array_equal(self.state, other.state)
+        return self.state == other.state
     
     def __hash__(self):
         """Hash function for the state."""
-        return hash(str(self.state))
+        return hash(self.state)
 
 class Puzzle8:
-    """Class for solving 8-puzzle problem using A* algorithm."""
+    """
+    Class for solving the N x N sliding puzzle (8-, 15-, 24-puzzle) using A*.
+    The board size is taken from the initial state unless given explicitly.
+    """
     
-    def __init__(self, initial_state=None):
-        """Initialize the puzzle with an initial state."""
+    def __init__(self, initial_state=None, heuristic=None, size=None):
+        """
+        Initialize the puzzle with an initial state.
+        heuristic is an optional callable taking a flat tile sequence (see
+        puzzle_heuristics); if it has update() children are scored incrementally.
+        By default the built-in Manhattan distance is used.
+        """
         if initial_state is None:
             # Default initial state
             self.initial_state = np.array([
@@ -42,90 +87,162 @@ class Puzzle8:
             ])
         else:
             self.initial_state = initial_state
+        
+        if size is None:
+            size = int(round(np.asarray(self.initial_state).size ** 0.5))
+        if np.asarray(self.initial_state).size != size * size:
+            raise ValueError(f"Initial state does not fit a {size}x{size} board")
+        self.size = size
+        self.bits = tile_bits(size)
+        self.mask = (1 << self.bits) - 1
             
         # Define the goal state
-        self.goal_state = np.array([
-            [1, 2, 3],
-            [4, 5, 6],
-            [7, 8, 0]
-        ])
+        self.goal_state = goal_board(size)
+        self.goal = pack_state(self.goal_state, self.bits)
+        self.heuristic = heuristic
+        # Heuristics with update() get the parent's value plus the moved tile
+        self.heuristic_update = getattr(heuristic, 'update', None)
+        
+        # Manhattan distance of every tile from every position, indexed [tile][pos]
+        cells = self.size * self.size
+        self.distance_table = self.build_distance_table(self.goal_state.flatten().tolist())
+        
+        # Legal moves of the blank from every position: (move_name, target_pos)
+        self.moves_from = []
+        for pos in range(cells):
+            row, col = divmod(pos, self.size)
+            moves = []
+            for move_name, (dr, dc) in (('up', (-1, 0)), ('down', (1, 0)),
+                                        ('left', (0, -1)), ('right', (0, 1))):
+                new_row, new_col = row + dr, col + dc
+                if 0 <= new_row < self.size and 0 <= new_col < self.size:
+                    moves.append((move_name, new_row * self.size + new_col))
+            self.moves_from.append(moves)
+    
+    def build_distance_table(self, target_tiles):
+        """Manhattan distance of every tile from every position to its cell in target_tiles."""
+        cells = self.size * self.size
+        table = [[0] * cells for _ in range(cells)]
+        for target_pos, tile in enumerate(target_tiles):
+            if tile == 0:
+                continue
+            target_row, target_col = divmod(target_pos, self.size)
+            for pos in range(cells):
+                row, col = divmod(pos, self.size)
+                table[tile][pos] = abs(row - target_row) + abs(col - target_col)
+        return table
     
     def find_blank(self, state):
-        """Find the position of the blank (0) in the state."""
-        blank_pos = np.where(state == 0)
-        return (blank_pos[0][0], blank_pos[1][0])
+        """Find the flat position of the blank (0) in a packed state."""
+        for pos in range(self.size * self.size):
+            if (state >> (self.bits * pos)) & self.mask == 0:
+                return pos
+        raise ValueError("State has no blank tile")
     
-    def get_neighbors(self, node):
-        """Get all possible neighbor states by moving the blank tile."""
+    def get_neighbors(self, node, distance_table=None):
+        """
+        Get all possible neighbor states by moving the blank tile.
+        A distance_table (see build_distance_table) scores the children by
+        Manhattan distance to that table's target instead of the goal.
+        """
         neighbors = []
-        blank_row, blank_col = self.find_blank(node.state)
-        
-        # Possible moves: up, down, left, right
-        moves = [
-            ('up', (-1, 0)),
-            ('down', (1, 0)),
-            ('left', (0, -1)),
-            ('right', (0, 1))
-        ]
-        
-        for move_name, (dr, dc) in moves:
-            new_row, new_col = blank_row + dr, blank_col + dc
-            
-            # Check if the move is valid
-            if 0 <= new_row < 3 and 0 <= new_col < 3:
-                # Create a new state by swapping tiles
-                new_state = node.state.copy()
-                new_state[blank_row, blank_col] = new_state[new_row, new_col]
-                new_state[new_row, new_col] = 0
-                
-                # Create a new node
-                new_node = PuzzleNode(
-                    state=new_state,
-                    parent=node,
-                    move=move_name,
-                    depth=node.depth + 1,
-                    cost=node.depth + 1,
-                    heuristic=self.calculate_heuristic(new_state)
-                )
-                
-                neighbors.append(new_node)
+        state = node.state
+        blank = node.blank
+        bits = self.bits
+        
+        for move_name, target in self.moves_from[blank]:
+            # Slide the tile at target into the blank: the blank's nibble is 0,
+            # so adding/subtracting the shifted tile swaps them in place.
+            tile = (state >> (bits * target)) & self.mask
+            new_state = state + (tile << (bits * blank)) - (tile << (bits * target))
+            
+            # Evaluate the child incrementally: only the moved tile changed
+            if distance_table is not None:
+                heuristic = (node.heuristic + distance_table[tile][blank]
+                             - distance_table[tile][target])
+            elif self.heuristic is None:
+                heuristic = (node.heuristic + self.distance_table[tile][blank]
+                             - self.distance_table[tile][target])
+            elif self.heuristic_update is not None:
+                heuristic = self.heuristic_update(node.heuristic, self._tiles(new_state),
+                                                  tile, target, blank)
+            else:
+                heuristic = self.heuristic(self._tiles(new_state))
+            
+            new_node = PuzzleNode(
+                state=new_state,
+                blank=target,
+                parent=node,
+                move=move_name,
+                depth=node.depth + 1,
+                cost=node.depth + 1,
+                heuristic=heuristic
+            )
+            
+            neighbors.append(new_node)
         
         return neighbors
     
     def calculate_heuristic(self, state):
         """
-        Calculate the heuristic value for the given state.
-        Using Manhattan distance heuristic.
+        Calculate the heuristic value for the given packed state.
+        Using Manhattan distance heuristic unless another one was supplied.
         """
+        if self.heuristic is not None:
+            return self.heuristic(self._tiles(state))
+        
+        bits, mask = self.bits, self.mask
         distance = 0
-        for i in range(3):
-            for j in range(3):
-                if state[i, j] != 0:
-                    # Find the goal position of the current tile
-                    goal_pos = np.where(self.goal_state == state[i, j])
-                    goal_row, goal_col = goal_pos[0][0], goal_pos[1][0]
-                    
-                    # Calculate Manhattan distance
-                    distance += abs(i - goal_row) + abs(j - goal_col)
+        distance_table = self.distance_table
+        for pos in range(self.size * self.size):
+            tile = (state >> (bits * pos)) & mask
+            if tile:
+                distance += distance_table[tile][pos]
         
         return distance
     
-    def solve(self):
-        """Solve the 8-puzzle using A* algorithm."""
+    def solve(self, cache=None, stats=None):
+        """
+        Solve the puzzle using A* algorithm.
+        With a solution_cache.SolutionCache, a cached initial board is answered
+        without searching. A cached state reached during the search is queued
+        as a finished path of its exact cost and returned once no cheaper path
+        can remain. Every solved path is recorded in the cache.
+        A search_stats.SearchStats passed as stats collects counters and the
+        time spent in the setup and search phases.
+        """
+        if stats is not None:
+            stats.mark()
+        initial = pack_state(self.initial_state, self.bits)
         initial_node = PuzzleNode(
-            state=self.initial_state,
-            heuristic=self.calculate_heuristic(self.initial_state)
+            state=initial,
+            blank=self.find_blank(initial),
+            heuristic=self.calculate_heuristic(initial)
         )
         
+        if cache is not None:
+            cached_moves = cache.lookup(self._tiles(initial))
+            if cached_moves is not None:
+                if stats is not None:
+                    stats.lap('setup')
+                return self._complete(initial_node, cached_moves, cache), 0, 1
+        
         # Priority queue for open list
         open_list = []
         heapq.heappush(open_list, initial_node)
         
         # Set for closed list to check if a state is already explored
         closed_set = set()
+        # Cached optimal completions of states found during this search
+        cached = {}
         
         nodes_expanded = 0
         max_queue_size = 1
+        generated = duplicates = pushes = 0
+        solution = None
+        trace = stats.trace if stats is not None else None
+        if stats is not None:
+            stats.lap('setup')
         
         while open_list:
             # Update max queue size
@@ -134,24 +251,538 @@ class Puzzle8:
             # Get the node with the lowest f value
             current_node = heapq.heappop(open_list)
             nodes_expanded += 1
+            if trace is not None:
+                trace('expand', current_node)
             
             # Check if goal is reached
-            if np.array_equal(current_node.state, self.goal_state):
-                return self.extract_solution(current_node), nodes_expanded, max_queue_size
+            if current_node.state == self.goal:
+                solution = self.extract_solution(current_node)
+                if cache is not None:
+                    self._record(solution, cache)
+                break
+            
+            # A cached completion popped: nothing cheaper is left in the queue
+            if current_node.move == CACHED_MOVE:
+                solution = self._complete(current_node.parent, cached[current_node.state], cache)
+                break
             
             # Add the current state to closed set
-            closed_set.add(str(current_node.state))
+            closed_set.add(current_node.state)
+            
+            if cache is not None and current_node.state not in cached:
+                cached_moves = cache.completion(self._tiles(current_node.state))
+                if cached_moves is not None:
+                    cached[current_node.state] = cached_moves
+                    pushes += 1
+                    heapq.heappush(open_list, PuzzleNode(
+                        state=current_node.state,
+                        blank=current_node.blank,
+                        parent=current_node,
+                        move=CACHED_MOVE,
+                        depth=current_node.depth + len(cached_moves),
+                        cost=current_node.depth + len(cached_moves)
+                    ))
             
             # Generate neighbors
             for neighbor in self.get_neighbors(current_node):
+                generated += 1
                 # Skip if this state is already explored
-                if str(neighbor.state) in closed_set:
+                if neighbor.state in closed_set:
+                    duplicates += 1
                     continue
                 
                 # Add to open list
+                pushes += 1
                 heapq.heappush(open_list, neighbor)
         
-        return None, nodes_expanded, max_queue_size  # No solution found
+        if stats is not None:
+            stats.add(expansions=nodes_expanded, generated=generated, duplicates=duplicates,
+                      pushes=pushes + 1, pops=nodes_expanded)
+            stats.frontier(max_queue_size)
+            stats.lap('search')
+        # solution is None if no solution was found
+        return solution, nodes_expanded, max_queue_size
+    
+    def solve_anytime(self, weights=(5, 3, 2, 1.5, 1.25, 1), time_limit=None, node_limit=None,
+                      stats=None):
+        """
+        Anytime weighted A*. Searches with f = g + w * h for each weight in
+        turn, pruning nodes that cannot beat the best solution so far, until
+        the weights run out, the time_limit (seconds) passes or node_limit
+        nodes have been expanded. A generator: after every finished step it
+        yields (solution_path, cost, bound), where bound is the proven ratio
+        of cost to the optimal cost (1.0 means optimal).
+        A search_stats.SearchStats passed as stats is updated before every
+        yield, which is also traced as a 'solution' event with (cost, bound).
+        """
+        if stats is not None:
+            stats.mark()
+        deadline = None if time_limit is None else time.perf_counter() + time_limit
+        initial = pack_state(self.initial_state, self.bits)
+        root = PuzzleNode(
+            state=initial,
+            blank=self.find_blank(initial),
+            heuristic=self.calculate_heuristic(initial)
+        )
+        
+        best_node = None
+        best_cost = None
+        nodes_expanded = 0
+        # Counts not yet passed to stats
+        counts = dict.fromkeys(('expansions', 'generated', 'duplicates', 'pushes', 'pops'), 0)
+        peak = 0
+        if stats is not None:
+            stats.lap('setup')
+        
+        def record():
+            stats.add(**counts)
+            stats.frontier(peak)
+            stats.lap('search')
+            for name in counts:
+                counts[name] = 0
+        
+        for weight in weights:
+            # Heap entries: (weighted f, insertion order, node)
+            open_list = [(weight * root.heuristic, 0, root)]
+            best_g = {initial: 0}
+            pushed = 1
+            expanded_before = nodes_expanded
+            generated = duplicates = pops = 0
+            out_of_budget = False
+            
+            while open_list:
+                if (deadline is not None and time.perf_counter() > deadline
+                        or node_limit is not None and nodes_expanded >= node_limit):
+                    out_of_budget = True
+                    break
+                
+                if stats is not None:
+                    peak = max(peak, len(open_list))
+                _, _, current_node = heapq.heappop(open_list)
+                pops += 1
+                if current_node.cost > best_g[current_node.state]:
+                    continue  # Stale entry, the state was reached more cheaply
+                if best_cost is not None and current_node.f >= best_cost:
+                    continue  # Cannot lead to a cheaper solution
+                
+                if current_node.state == self.goal:
+                    best_node, best_cost = current_node, current_node.cost
+                    break
+                
+                nodes_expanded += 1
+                for neighbor in self.get_neighbors(current_node):
+                    generated += 1
+                    if neighbor.cost < best_g.get(neighbor.state, neighbor.cost + 1):
+                        best_g[neighbor.state] = neighbor.cost
+                        heapq.heappush(open_list, (neighbor.cost + weight * neighbor.heuristic, pushed, neighbor))
+                        pushed += 1
+                    else:
+                        duplicates += 1
+            
+            counts['expansions'] += nodes_expanded - expanded_before
+            counts['generated'] += generated
+            counts['duplicates'] += duplicates
+            counts['pushes'] += pushed
+            counts['pops'] += pops
+            if out_of_budget or best_node is None:
+                if stats is not None:
+                    record()
+                return  # Out of budget, or no solution found
+            
+            # Any cheaper solution must pass through a live open node
+            lower_bound = best_cost
+            for _, _, node in open_list:
+                if node.cost == best_g[node.state] and node.f < lower_bound:
+                    lower_bound = node.f
+            bound = best_cost / lower_bound if lower_bound else 1.0
+            
+            if stats is not None:
+                record()
+                stats.event('solution', (best_cost, bound))
+            yield self.extract_solution(best_node), best_cost, bound
+            if stats is not None:
+                stats.mark()  # time spent by the caller is not search time
+            if bound <= 1.0:
+                return
+    
+    def solve_vectorized(self, batch_size=256, stats=None):
+        """
+        Solve the puzzle with A*, expanding up to batch_size frontier nodes of
+        the lowest f value at a time with whole-array NumPy operations: the
+        batch is unpacked into one 2-D tile array, and move validity, child keys
+        and incremental Manhattan distances are computed for all children at
+        once. Ties in f go to the deeper node. States that get a cheaper path
+        later are reopened, and a goal is only accepted when it is the smallest
+        entry of the queue, so the result stays optimal.
+        Manhattan distance only: children are scored from its per-tile deltas,
+        so a puzzle built with another heuristic raises ValueError. Needs
+        bits * cells <= 64 (up to the 15-puzzle). Returns the same tuple as solve(), and fills a
+        search_stats.SearchStats passed as stats as solve() does.
+        """
+        if stats is not None:
+            stats.mark()
+        cells = self.size * self.size
+        if self.bits * cells > 64:
+            raise ValueError("Vectorized search needs packed states that fit in 64 bits")
+        if self.heuristic is not None:
+            raise ValueError("Vectorized search only supports the built-in Manhattan distance")
+        
+        bits = np.uint64(self.bits)
+        shifts = np.arange(cells, dtype=np.uint64) * bits
+        mask = np.uint64(self.mask)
+        distance_table = np.array(self.distance_table, dtype=np.int64)
+        move_names = ['up', 'down', 'left', 'right']
+        # Target cell of the blank for every (position, move), -1 where illegal
+        targets = np.full((cells, len(move_names)), -1, dtype=np.int64)
+        for pos, moves in enumerate(self.moves_from):
+            for move_name, target in moves:
+                targets[pos, move_names.index(move_name)] = target
+        
+        initial = pack_state(self.initial_state, self.bits)
+        # Node arena: parallel lists indexed by node id
+        states = [initial]
+        parents = [-1]
+        moves = [-1]
+        costs = [0]
+        heuristics = [self.calculate_heuristic(initial)]
+        best_g = {initial: 0}
+        # Heap entries: (f, h, node); among equal f the deeper node comes first
+        open_list = [(heuristics[0], heuristics[0], 0)]
+        
+        nodes_expanded = 0
+        max_queue_size = 1
+        generated = pops = requeued = 0
+        solution = None
+        if stats is not None:
+            stats.lap('setup')
+        
+        while open_list and solution is None:
+            max_queue_size = max(max_queue_size, len(open_list))
+            
+            # Pop a batch of live nodes sharing the smallest f value
+            batch = []
+            batch_f = open_list[0][0]
+            while open_list and len(batch) < batch_size and open_list[0][0] == batch_f:
+                entry = heapq.heappop(open_list)
+                pops += 1
+                node = entry[2]
+                state = states[node]
+                if costs[node] > best_g[state]:
+                    continue  # Stale entry, the state was reached more cheaply
+                if state == self.goal:
+                    if not batch:
+                        solution = self._arena_solution(states, parents, moves, move_names, node)
+                        break
+                    # Nodes ahead of it in the batch may still lead somewhere cheaper
+                    heapq.heappush(open_list, entry)
+                    requeued += 1
+                    break
+                batch.append(node)
+            if not batch:
+                continue
+            nodes_expanded += len(batch)
+            
+            keys = np.array([states[node] for node in batch], dtype=np.uint64)
+            boards = ((keys[:, None] >> shifts) & mask).astype(np.int64)
+            blanks = np.argmin(boards, axis=1)
+            
+            # One row per legal (parent, move) pair
+            batch_targets = targets[blanks]
+            parent_rows, move_codes = np.nonzero(batch_targets >= 0)
+            generated += len(parent_rows)
+            child_blanks = batch_targets[parent_rows, move_codes]
+            parent_blanks = blanks[parent_rows]
+            tiles = boards[parent_rows, child_blanks]
+            
+            tiles_u = tiles.astype(np.uint64)
+            child_keys = (keys[parent_rows]
+                          + (tiles_u << (parent_blanks.astype(np.uint64) * bits))
+                          - (tiles_u << (child_blanks.astype(np.uint64) * bits)))
+            parent_ids = np.array(batch, dtype=np.int64)[parent_rows]
+            child_costs = np.array([costs[node] for node in batch], dtype=np.int64)[parent_rows] + 1
+            child_heuristics = (np.array([heuristics[node] for node in batch], dtype=np.int64)[parent_rows]
+                                + distance_table[tiles, parent_blanks]
+                                - distance_table[tiles, child_blanks])
+            
+            # Keep only the cheapest copy of each child key within the batch
+            order = np.lexsort((child_costs, child_keys))
+            first = np.ones(len(order), dtype=bool)
+            first[1:] = child_keys[order][1:] != child_keys[order][:-1]
+            keep = order[first]
+            
+            for key, cost, heuristic, parent, move in zip(
+                    child_keys[keep].tolist(), child_costs[keep].tolist(),
+                    child_heuristics[keep].tolist(), parent_ids[keep].tolist(),
+                    move_codes[keep].tolist()):
+                if cost < best_g.get(key, cost + 1):
+                    best_g[key] = cost
+                    states.append(key)
+                    parents.append(parent)
+                    moves.append(move)
+                    costs.append(cost)
+                    heuristics.append(heuristic)
+                    heapq.heappush(open_list, (cost + heuristic, heuristic, len(states) - 1))
+        
+        if stats is not None:
+            # Every arena node was pushed once, plus goals put back for a later batch
+            stats.add(expansions=nodes_expanded, generated=generated,
+                      duplicates=generated - (len(states) - 1), pushes=len(states) + requeued, pops=pops)
+            stats.frontier(max_queue_size)
+            stats.lap('search')
+        # solution is None if no solution was found
+        return solution, nodes_expanded, max_queue_size
+    
+    def _arena_solution(self, states, parents, moves, move_names, node):
+        """Solution path, as extract_solution returns it, for a node of the vectorized arena."""
+        path = []
+        while node != -1:
+            move = move_names[moves[node]] if moves[node] >= 0 else None
+            path.append((unpack_state(states[node], self.size, self.bits), move))
+            node = parents[node]
+        return path[::-1]
+    
+    def _complete(self, node, cached_moves, cache):
+        """Solution path through node followed by cached moves (prac2 letters) to the goal."""
+        for letter in cached_moves:
+            move_name = MOVE_NAMES[letter]
+            for neighbor in self.get_neighbors(node):
+                if neighbor.move == move_name:
+                    node = neighbor
+                    break
+        solution = self.extract_solution(node)
+        self._record(solution, cache)
+        return solution
+    
+    def _record(self, solution, cache):
+        """Record every state of a solution path in a SolutionCache."""
+        boards = [state.flatten().tolist() for state, _ in solution]
+        moves = [MOVE_LETTERS[move] for _, move in solution[1:]]
+        cache.record(boards, moves)
+    
+    def solve_ida_star(self, stats=None):
+        """
+        Solve the puzzle using IDA* (iterative deepening A*).
+        Memory grows only with the solution depth: just the current path is kept.
+        Returns the solution path, the total nodes expanded, and a list of
+        (threshold, nodes_expanded) pairs, one per iteration.
+        A search_stats.SearchStats passed as stats collects the counters, with
+        children over the threshold as cutoffs, and gets each finished
+        iteration traced as an 'iteration' event with its pair.
+        """
+        # The thresholds would rise forever on a board of the wrong parity
+        if not is_solvable(self.initial_state):
+            return None, 0, []
+        
+        if stats is not None:
+            stats.mark()
+        initial = pack_state(self.initial_state, self.bits)
+        root = PuzzleNode(
+            state=initial,
+            blank=self.find_blank(initial),
+            heuristic=self.calculate_heuristic(initial)
+        )
+        
+        threshold = root.f
+        nodes_expanded = 0
+        iterations = []
+        # Expanded, generated and duplicate nodes over all iterations
+        counter = [0, 0, 0]
+        trace = stats.trace if stats is not None else None
+        if stats is not None:
+            stats.lap('setup')
+        
+        while True:
+            expanded_before = counter[0]
+            goal_node, next_threshold = self._ida_search(root, threshold, {initial}, counter, trace)
+            iterations.append((threshold, counter[0] - expanded_before))
+            if stats is not None:
+                stats.event('iteration', iterations[-1])
+            
+            if goal_node is not None or next_threshold is None:
+                break
+            threshold = next_threshold
+        
+        nodes_expanded, generated, duplicates = counter
+        if stats is not None:
+            # Every _ida_search call not expanded was cut off by the threshold:
+            # one call per root and per child not already on the path
+            stats.add(expansions=nodes_expanded, generated=generated, duplicates=duplicates,
+                      cutoffs=len(iterations) + generated - duplicates - nodes_expanded)
+            if goal_node is not None:
+                stats.frontier(goal_node.depth)
+            stats.lap('search')
+        if goal_node is None:
+            return None, nodes_expanded, iterations  # No solution found
+        return self.extract_solution(goal_node), nodes_expanded, iterations
+    
+    def _ida_search(self, node, threshold, path_states, counter, trace=None):
+        """Depth-first search bounded by threshold; returns (goal_node, next_threshold)."""
+        if node.f > threshold:
+            return None, node.f
+        
+        counter[0] += 1
+        if trace is not None:
+            trace('expand', node)
+        if node.state == self.goal:
+            return node, None
+        
+        next_threshold = None
+        for neighbor in self.get_neighbors(node):
+            counter[1] += 1
+            # Skip states already on the current path (includes undoing the last move)
+            if neighbor.state in path_states:
+                counter[2] += 1
+                continue
+            
+            path_states.add(neighbor.state)
+            goal_node, candidate = self._ida_search(neighbor, threshold, path_states, counter, trace)
+            path_states.discard(neighbor.state)
+            
+            if goal_node is not None:
+                return goal_node, None
+            if candidate is not None and (next_threshold is None or candidate < next_threshold):
+                next_threshold = candidate
+        
+        return None, next_threshold
+    
+    def solve_bidirectional(self, stats=None):
+        """
+        Solve the puzzle with front-to-end bidirectional A*: one search runs
+        forward from the initial state towards the goal, the other backward
+        from the goal using Manhattan distance to the initial state. The side
+        with the smaller open list is expanded next, and the search stops once
+        neither frontier can hold a path cheaper than the best meeting found.
+        Returns the solution path and the nodes expanded per direction.
+        A search_stats.SearchStats passed as stats collects the counters of
+        both directions, and every cheaper meeting is traced as a 'meet'
+        event with the path cost.
+        """
+        if stats is not None:
+            stats.mark()
+        initial = pack_state(self.initial_state, self.bits)
+        forward_root = PuzzleNode(
+            state=initial,
+            blank=self.find_blank(initial),
+            heuristic=self.calculate_heuristic(initial)
+        )
+        expanded = {'forward': 0, 'backward': 0}
+        if initial == self.goal:
+            if stats is not None:
+                stats.lap('setup')
+            return self.extract_solution(forward_root), expanded
+        
+        backward_table = self.build_distance_table(self._tiles(initial))
+        backward_root = PuzzleNode(
+            state=self.goal,
+            blank=self.find_blank(self.goal),
+            heuristic=sum(backward_table[tile][pos] for pos, tile in enumerate(self._tiles(self.goal)))
+        )
+        
+        # Per direction: open list, best node per state, closed set, heuristic table
+        sides = {
+            'forward': ([forward_root], {initial: forward_root}, set(), None),
+            'backward': ([backward_root], {self.goal: backward_root}, set(), backward_table),
+        }
+        best_cost = None
+        meeting = None  # (forward node, backward node) of the best path found
+        generated = duplicates = pops = 0
+        peak = 2
+        if stats is not None:
+            stats.lap('setup')
+        
+        while sides['forward'][0] and sides['backward'][0]:
+            # Every unfound path must cross both frontiers, so it costs at least
+            # the larger of the two smallest f values
+            bound = max(sides['forward'][0][0].f, sides['backward'][0][0].f)
+            if best_cost is not None and best_cost <= bound:
+                break
+            
+            direction = 'forward' if len(sides['forward'][0]) <= len(sides['backward'][0]) else 'backward'
+            other = 'backward' if direction == 'forward' else 'forward'
+            open_list, best, closed_set, distance_table = sides[direction]
+            other_best = sides[other][1]
+            
+            if stats is not None:
+                peak = max(peak, len(sides['forward'][0]) + len(sides['backward'][0]))
+            current_node = heapq.heappop(open_list)
+            pops += 1
+            if current_node.state in closed_set:
+                continue  # Stale entry, the state was reached more cheaply
+            closed_set.add(current_node.state)
+            expanded[direction] += 1
+            
+            for neighbor in self.get_neighbors(current_node, distance_table):
+                generated += 1
+                if neighbor.state in closed_set:
+                    duplicates += 1
+                    continue
+                known = best.get(neighbor.state)
+                if known is not None and known.cost <= neighbor.cost:
+                    duplicates += 1
+                    continue
+                best[neighbor.state] = neighbor
+                heapq.heappush(open_list, neighbor)
+                
+                # Did the two searches meet with a cheaper path?
+                match = other_best.get(neighbor.state)
+                if match is not None and (best_cost is None or neighbor.cost + match.cost < best_cost):
+                    best_cost = neighbor.cost + match.cost
+                    meeting = (neighbor, match) if direction == 'forward' else (match, neighbor)
+                    if stats is not None:
+                        stats.event('meet', best_cost)
+        
+        if stats is not None:
+            # Both roots plus every child not pruned were pushed
+            stats.add(expansions=expanded['forward'] + expanded['backward'], generated=generated,
+                      duplicates=duplicates, pushes=2 + generated - duplicates, pops=pops)
+            stats.frontier(peak)
+            stats.lap('search')
+        if meeting is None:
+            return None, expanded  # No solution found
+        
+        # Forward half as usual, then replay the backward half towards the goal:
+        # each backward step is undone by moving the blank the opposite way
+        forward_node, backward_node = meeting
+        path = self.extract_solution(forward_node)
+        while backward_node.parent is not None:
+            path.append((unpack_state(backward_node.parent.state, self.size, self.bits),
+                         OPPOSITE_MOVES[backward_node.move]))
+            backward_node = backward_node.parent
+        
+        return path, expanded
+    
+    def solve_with_table(self, table):
+        """
+        Solve the 8-puzzle with a precomputed distance_table.DistanceTable:
+        from each node step to the neighbor one move closer, no search needed.
+        """
+        if self.size != 3:
+            raise ValueError("Distance tables are only available for the 8-puzzle")
+        
+        initial = pack_state(self.initial_state, self.bits)
+        node = PuzzleNode(
+            state=initial,
+            blank=self.find_blank(initial),
+            heuristic=self.calculate_heuristic(initial)
+        )
+        distance = table.distance(self._tiles(initial))
+        if distance is None:
+            return None  # No solution found
+        
+        while distance > 0:
+            for neighbor in self.get_neighbors(node):
+                if table.distance(self._tiles(neighbor.state)) == distance - 1:
+                    node = neighbor
+                    distance -= 1
+                    break
+            else:
+                raise ValueError("Distance table is inconsistent")
+        
+        return self.extract_solution(node)
+    
+    def _tiles(self, state):
+        """Flat list of tiles of a packed state."""
+        return [(state >> (self.bits * pos)) & self.mask for pos in range(self.size * self.size)]
     
     def extract_solution(self, goal_node):
         """Extract the solution path from initial state to goal state."""
@@ -159,7 +790,7 @@ class Puzzle8:
         current = goal_node
         
         while current:
-            path.append((current.state, current.move))
+            path.append((unpack_state(current.state, self.size, self.bits), current.move))
             current = current.parent
         
         return path[::-1]  # Reverse to get path from initial to goal
@@ -181,18 +812,19 @@ class Puzzle8:
             for row in state:
                 print(" ".join(str(cell) if cell != 0 else "_" for cell in row))
 
-def get_user_input():
+def get_user_input(size=3):
     """Get the initial state from the user."""
-    print("Enter the initial state of the 8-puzzle (use 0 for the blank):")
-    print("Enter each row with spaces between numbers (e.g., '1 2 3'):")
+    largest = size * size - 1
+    print(f"Enter the initial state of the {largest}-puzzle (use 0 for the blank):")
+    print(f"Enter each row with spaces between numbers (e.g., '{' '.join(str(n) for n in range(1, size + 1))}'):")
     
     initial_state = []
-    for i in range(3):
+    for i in range(size):
         while True:
             try:
                 row = list(map(int, input(f"Row {i+1}: ").strip().split()))
-                if len(row) != 3 or not all(0 <= n <= 8 for n in row):
-                    print("Each row must have exactly 3 numbers between 0 and 8.")
+                if len(row) != size or not all(0 <= n <= largest for n in row):
+                    print(f"Each row must have exactly {size} numbers between 0 and {largest}.")
                     continue
                 initial_state.append(row)
                 break
@@ -201,23 +833,51 @@ def get_user_input():
     
     return np.array(initial_state)
 
+def count_inversions(tiles):
+    """Count pairs out of order in tiles using merge sort, O(n log n)."""
+    if len(tiles) <= 1:
+        return 0, list(tiles)
+    
+    middle = len(tiles) // 2
+    left_inversions, left = count_inversions(tiles[:middle])
+    right_inversions, right = count_inversions(tiles[middle:])
+    inversions = left_inversions + right_inversions
+    
+    merged = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        if left[i] <= right[j]:
+            merged.append(left[i])
+            i += 1
+        else:
+            # Every tile still waiting on the left is greater than right[j]
+            merged.append(right[j])
+            inversions += len(left) - i
+            j += 1
+    merged.extend(left[i:])
+    merged.extend(right[j:])
+    
+    return inversions, merged
+
 def is_solvable(state):
-    """Check if the puzzle is solvable."""
+    """Check if the puzzle is solvable (goal has the blank in the last cell)."""
+    flat = np.asarray(state).flatten().tolist()
+    size = int(round(len(flat) ** 0.5))
+    
     # Flatten the state but ignore the blank (0)
-    flat_state = [num for num in state.flatten() if num != 0]
+    inversions, _ = count_inversions([num for num in flat if num != 0])
     
-    # Count inversions
-    inversions = 0
-    for i in range(len(flat_state)):
-        for j in range(i + 1, len(flat_state)):
-            if flat_state[i] > flat_state[j]:
-                inversions += 1
+    if size % 2 == 1:
+        # Odd width: a move never changes inversion parity, so it must be even
+        return inversions % 2 == 0
     
-    # For 8-puzzle, if the number of inversions is even, the puzzle is solvable
-    return inversions % 2 == 0
+    # Even width: a vertical move flips inversion parity and the blank's row,
+    # so inversions plus the blank's row counted from the bottom (1-based) must be odd
+    blank_row_from_bottom = size - flat.index(0) // size
+    return (inversions + blank_row_from_bottom) % 2 == 1
 
 def main():
-    """Main function to solve the 8-puzzle."""
+    """Main function to solve the sliding puzzle."""
     print("8-Puzzle Solver using A* algorithm")
     print("----------------------------------")
     
@@ -231,7 +891,8 @@ def main():
              7, 0, 8]
         ])
     else:
-        initial_state = get_user_input()
+        size = input("Board size (3 for 8-puzzle, 4 for 15-puzzle, 5 for 24-puzzle) [3]: ").strip()
+        initial_state = get_user_input(int(size) if size else 3)
     
     # Check if the puzzle is solvable
     if not is_solvable(initial_state):
@@ -240,13 +901,53 @@ def main():
     
     # Create puzzle and solve
     puzzle = Puzzle8(initial_state)
+    
+    # Built with `python distance_table.py`; the default mode when present
+    table = load_distance_table() if puzzle.size == 3 else None
+    if table is not None:
+        mode = input("Search mode: distance table, A*, IDA* (low memory), bidirectional, anytime "
+                     "or vectorized A*? (t/a/i/b/w/v) [t]: ").lower() or 't'
+    else:
+        mode = input("Search mode: A*, IDA* (low memory), bidirectional, anytime or vectorized A*? (a/i/b/w/v): ").lower()
+    use_ida = mode == 'i'
+    
+    if mode == 't' and table is not None:
+        print("\nSolving puzzle from the precomputed distance table...")
+        puzzle.print_solution(puzzle.solve_with_table(table))
+        return
+    
+    if mode == 'w':
+        budget = float(input("Time budget in seconds: "))
+        print("\nSolving puzzle...")
+        solution = None
+        for solution, cost, bound in puzzle.solve_anytime(time_limit=budget):
+            print(f"Found a solution of {cost} moves, at most {bound:.2f}x optimal")
+        puzzle.print_solution(solution)
+        return
+    
     print("\nSolving puzzle...")
-    solution, nodes_expanded, max_queue_size = puzzle.solve()
+    if mode == 'b':
+        solution, expanded = puzzle.solve_bidirectional()
+        puzzle.print_solution(solution)
+        print(f"\nNodes expanded forward: {expanded['forward']}")
+        print(f"Nodes expanded backward: {expanded['backward']}")
+        return
+    elif use_ida:
+        solution, nodes_expanded, iterations = puzzle.solve_ida_star()
+    elif mode == 'v':
+        solution, nodes_expanded, max_queue_size = puzzle.solve_vectorized()
+    else:
+        solution, nodes_expanded, max_queue_size = puzzle.solve()
     
     # Print results
     puzzle.print_solution(solution)
     print(f"\nNodes expanded: {nodes_expanded}")
-    print(f"Maximum queue size: {max_queue_size}")
+    if use_ida:
+        print(f"Iterations: {len(iterations)}")
+        for threshold, expanded in iterations:
+            print(f"  threshold {threshold}: {expanded} nodes expanded")
+    else:
+        print(f"Maximum queue size: {max_queue_size}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
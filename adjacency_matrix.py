@@ -0,0 +1,160 @@
+import sys
+
+import numpy as np
+
+from csr_graph import CSRGraph
+
+# Adjacency matrices that do not store n x n Python ints.
+#
+#   BitMatrix     one bit per cell, each row packed into bytes (np.packbits
+#                 layout: column 0 is the high bit of the first byte), n^2 / 8 bytes
+#   SparseMatrix  a set of columns per non-empty row, memory proportional to
+#                 the number of edges, for graphs too large for n^2 bits
+#
+# Both answer has_edge(u, v) in O(1) and hand out rows one at a time, so a
+# matrix can be printed by streaming rows without building all of them.
+
+# Above this many bytes of bits, adjacency_matrix() picks the sparse form
+DENSE_LIMIT = 64 * 1024 * 1024
+
+
+def _edge_arrays(graph):
+    """All (u, v) entries of a dict-of-lists or CSRGraph as two int64 arrays."""
+    if isinstance(graph, CSRGraph):
+        offsets = np.frombuffer(graph.offsets, dtype=np.int64)
+        return (np.repeat(np.arange(len(graph), dtype=np.int64), np.diff(offsets)),
+                np.frombuffer(graph.targets, dtype=np.int32).astype(np.int64))
+    sources = []
+    targets = []
+    for node, neighbors in graph.items():
+        sources.append(np.full(len(neighbors), node, dtype=np.int64))
+        targets.append(np.asarray(neighbors, dtype=np.int64))
+    if not sources:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(sources), np.concatenate(targets)
+
+
+class AdjacencyMatrix:
+    """Operations shared by the matrix types; subclasses store the cells."""
+
+    def __init__(self, n):
+        self.n = n
+
+    @classmethod
+    def from_graph(cls, graph, n, symmetric=False):
+        """
+        Matrix of a dict of neighbor lists or CSRGraph: cell [u][v] is 1 for
+        every neighbor v of u (and [v][u] too if symmetric).
+        """
+        matrix = cls(n)
+        sources, targets = _edge_arrays(graph)
+        matrix.add_edges(sources, targets)
+        if symmetric:
+            matrix.add_edges(targets, sources)
+        return matrix
+
+    def __contains__(self, edge):
+        return self.has_edge(*edge)
+
+    def nbytes(self):
+        """Bytes held by the stored cells, comparable across matrix types."""
+        raise NotImplementedError
+
+    def rows(self):
+        """Each row as a list of 0/1 ints, one row at a time."""
+        for u in range(self.n):
+            yield self.row(u).tolist()
+
+    def write(self, file=None):
+        """Print the matrix with a column header, streaming one row at a time."""
+        file = file or sys.stdout
+        file.write("   " + "".join(f"{i} " for i in range(self.n)) + "\n")
+        for u in range(self.n):
+            file.write(f"{u}  " + "".join(f"{cell} " for cell in self.row(u).tolist()) + "\n")
+
+
+class BitMatrix(AdjacencyMatrix):
+    """Dense adjacency matrix, one bit per cell."""
+
+    def __init__(self, n):
+        super().__init__(n)
+        self.bits = np.zeros((n, (n + 7) // 8), dtype=np.uint8)
+
+    def add_edge(self, u, v):
+        self.bits[u, v >> 3] |= 0x80 >> (v & 7)
+
+    def add_edges(self, sources, targets):
+        """Set many cells at once from parallel index arrays."""
+        targets = np.asarray(targets, dtype=np.int64)
+        np.bitwise_or.at(self.bits, (np.asarray(sources, dtype=np.int64), targets >> 3),
+                         (0x80 >> (targets & 7)).astype(np.uint8))
+
+    def has_edge(self, u, v):
+        return bool(self.bits[u, v >> 3] & (0x80 >> (v & 7)))
+
+    def row(self, u):
+        """Row u as a uint8 array of 0s and 1s."""
+        return np.unpackbits(self.bits[u], count=self.n)
+
+    def neighbors(self, u):
+        """Columns set in row u, ascending."""
+        return np.flatnonzero(self.row(u))
+
+    def nbytes(self):
+        """Bytes of the packed bit array."""
+        return self.bits.nbytes
+
+    def __repr__(self):
+        return f"BitMatrix(n={self.n}, cells set={int(np.unpackbits(self.bits).sum())})"
+
+
+class SparseMatrix(AdjacencyMatrix):
+    """Adjacency matrix storing only the set cells: a set of columns per row."""
+
+    def __init__(self, n):
+        super().__init__(n)
+        self._rows = {}
+
+    def add_edge(self, u, v):
+        self._rows.setdefault(u, set()).add(v)
+
+    def add_edges(self, sources, targets):
+        for u, v in zip(np.asarray(sources).tolist(), np.asarray(targets).tolist()):
+            self._rows.setdefault(u, set()).add(v)
+
+    def has_edge(self, u, v):
+        columns = self._rows.get(u)
+        return columns is not None and v in columns
+
+    def row(self, u):
+        """Row u as a uint8 array of 0s and 1s (built on demand)."""
+        row = np.zeros(self.n, dtype=np.uint8)
+        columns = self._rows.get(u)
+        if columns:
+            row[list(columns)] = 1
+        return row
+
+    def neighbors(self, u):
+        """Columns set in row u, ascending."""
+        return sorted(self._rows.get(u, ()))
+
+    def nbytes(self):
+        """Bytes of the row dict, its sets and the int objects in them (sys.getsizeof)."""
+        total = sys.getsizeof(self._rows)
+        for u, columns in self._rows.items():
+            total += sys.getsizeof(u) + sys.getsizeof(columns) + sum(map(sys.getsizeof, columns))
+        return total
+
+    def __repr__(self):
+        cells = sum(len(columns) for columns in self._rows.values())
+        return f"SparseMatrix(n={self.n}, cells set={cells})"
+
+
+def adjacency_matrix(graph, n, symmetric=False, sparse=None):
+    """
+    BitMatrix of graph, or a SparseMatrix when sparse is true or, by
+    default, when the bits would take more than DENSE_LIMIT bytes.
+    """
+    if sparse is None:
+        sparse = n * ((n + 7) // 8) > DENSE_LIMIT
+    return (SparseMatrix if sparse else BitMatrix).from_graph(graph, n, symmetric)
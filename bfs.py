@@ -1,13 +1,24 @@
 from collections import deque
 
+from csr_graph import CSRGraph
+from edge_loader import add_arguments, load_from_args
 
-def bfs(graph, start_node):
+
+def bfs(graph, start_node, stats=None):
+    # stats: optional search_stats.SearchStats to collect counters and timings
+    if stats is not None:
+        stats.mark()
     queue = deque([start_node])  # Initialize queue with the start_node
     visited = {start_node}       # Mark start_node as visited
     traversal_order = [start_node]  # Add start_node to the traversal order
 
     print("Starting BFS from node:", start_node)
+    if stats is None and isinstance(graph, CSRGraph) and start_node in graph:
+        # Same order from a loop over the flat arrays
+        return graph.bfs_order(start_node)
     while queue:
+        if stats is not None:
+            stats.frontier(len(queue))
         current_node = queue.popleft()
 
         for neighbor in graph.get(current_node, []):
@@ -16,10 +27,18 @@ def bfs(graph, start_node):
                 queue.append(neighbor)
                 traversal_order.append(neighbor)  # Add neighbor to traversal order when discovered
 
+    if stats is not None:
+        # Every visited node was queued, popped and expanded exactly once;
+        # every other neighbor seen was a duplicate
+        visited_count = len(traversal_order)
+        generated = sum(len(graph.get(node, [])) for node in traversal_order)
+        stats.add(expansions=visited_count, pushes=visited_count, pops=visited_count,
+                  generated=generated, duplicates=generated - visited_count + 1)
+        stats.lap('search')
     return traversal_order
 
 
-def main():
+def read_graph():
     graph = {}
     n = int(input("Enter number of Nodes in the graph: "))
     for i in range(n):
@@ -44,8 +63,25 @@ def main():
     print("Graph Created.")
     print("Adjacency List:")
     print(graph)
+    return graph, n
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Breadth-first traversal of a graph.")
+    add_arguments(parser)
+    parser.add_argument("-s", "--start", type=int, help="starting node (prompted for if omitted)")
+    args = parser.parse_args(argv)
+
+    if args.edges:
+        graph = load_from_args(args)
+        n = len(graph)
+        print(f"Graph loaded from {args.edges}: {n} nodes, {graph.num_edges} adjacency entries")
+    else:
+        graph, n = read_graph()
 
-    start_node = int(input("Enter starting node: "))
+    start_node = args.start if args.start is not None else int(input("Enter starting node: "))
     if 0 <= start_node < n:
         bfs_result = bfs(graph, start_node)
         print("BFS Traversal of Graph: ")
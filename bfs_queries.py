@@ -0,0 +1,255 @@
+from array import array
+from collections import OrderedDict
+
+from connectivity import ConnectivityIndex
+
+# Hop-count queries on an unweighted graph (a dict of neighbor lists keyed
+# 0 .. n-1, or a csr_graph.CSRGraph):
+#
+#   bfs_tree             distance and parent arrays from one or more sources
+#   shortest_path        point-to-point path by bidirectional BFS, which stops
+#                        as soon as the two searches meet
+#   BFSQueryCache        answers repeated queries, keeping the BFS trees of
+#                        frequently queried sources in an LRU cache that is
+#                        cleared whenever the graph is changed through it;
+#                        on undirected graphs a connectivity index answers
+#                        unreachable pairs before any search runs
+#
+# Graphs are taken as undirected. For a directed graph pass the reversed
+# graph as reverse, so the backward search follows edges the right way.
+
+UNREACHED = -1
+
+
+def bfs_tree(graph, sources, n=None):
+    """
+    Multi-source BFS. Returns (distances, parents) as int arrays of length n:
+    hops to the nearest source and the previous node on such a path, with
+    UNREACHED for nodes that cannot be reached (and as the sources' parents).
+    """
+    if isinstance(sources, int):
+        sources = [sources]
+    n = len(graph) if n is None else n
+    distances = array('i', [UNREACHED]) * n
+    parents = array('i', [UNREACHED]) * n
+    frontier = []
+    for source in sources:
+        if distances[source] == UNREACHED:
+            distances[source] = 0
+            frontier.append(source)
+
+    distance = 0
+    while frontier:
+        distance += 1
+        next_frontier = []
+        for node in frontier:
+            for neighbor in graph.get(node, ()):
+                if distances[neighbor] == UNREACHED:
+                    distances[neighbor] = distance
+                    parents[neighbor] = node
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return distances, parents
+
+
+def tree_path(parents, target):
+    """Path from the tree's source to a reached target, following parents."""
+    path = [target]
+    while parents[path[-1]] != UNREACHED:
+        path.append(parents[path[-1]])
+    path.reverse()
+    return path
+
+
+def _expand(graph, frontier, parents, other):
+    """
+    Expand one whole BFS level. Returns the next frontier and the best
+    meeting point with the other search, as (other side's depth, node, neighbor).
+    """
+    next_frontier = []
+    meeting = None
+    for node in frontier:
+        for neighbor in graph.get(node, ()):
+            if neighbor in other and (meeting is None or other[neighbor][1] < meeting[0]):
+                meeting = (other[neighbor][1], node, neighbor)
+            if neighbor not in parents:
+                parents[neighbor] = (node, parents[node][1] + 1)
+                next_frontier.append(neighbor)
+    return next_frontier, meeting
+
+
+def shortest_path(graph, source, target, reverse=None, index=None):
+    """
+    Shortest path from source to target as a node list (None if there is
+    none), by BFS from both ends, always growing the smaller frontier. The
+    level that first touches the other search is finished and the best
+    meeting point taken, which keeps the path shortest. With a
+    connectivity.ConnectivityIndex, unreachable targets are answered
+    without searching.
+    """
+    if source == target:
+        return [source]
+    if index is not None and not index.connected(source, target):
+        return None
+    reverse = graph if reverse is None else reverse
+    # node -> (previous node towards that side's root, depth)
+    forward = {source: (None, 0)}
+    backward = {target: (None, 0)}
+    forward_frontier = [source]
+    backward_frontier = [target]
+
+    while forward_frontier and backward_frontier:
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_frontier, meeting = _expand(graph, forward_frontier, forward, backward)
+            if meeting is not None:
+                _, before, after = meeting
+                break
+        else:
+            backward_frontier, meeting = _expand(reverse, backward_frontier, backward, forward)
+            if meeting is not None:
+                _, after, before = meeting
+                break
+    else:
+        return None
+
+    path = [before]
+    while forward[path[-1]][0] is not None:
+        path.append(forward[path[-1]][0])
+    path.reverse()
+    path.append(after)
+    while backward[path[-1]][0] is not None:
+        path.append(backward[path[-1]][0])
+    return path
+
+
+def shortest_path_length(graph, source, target, reverse=None, index=None):
+    """Hop count from source to target, or None if unreachable."""
+    path = shortest_path(graph, source, target, reverse, index)
+    return None if path is None else len(path) - 1
+
+
+class BFSQueryCache:
+    """
+    Distance and path queries on one graph. A source queried promote_after
+    times gets its full BFS tree computed and kept (at most capacity trees,
+    least recently used evicted); other queries use bidirectional BFS.
+    """
+
+    def __init__(self, graph, capacity=32, promote_after=2, directed=False):
+        self.graph = graph
+        self.capacity = capacity
+        self.promote_after = promote_after
+        self.directed = directed
+        self._trees = OrderedDict()
+        self._query_counts = {}
+        self._reverse = None
+        self._index = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def tree(self, sources):
+        """(distances, parents) from sources (an int or a sequence), cached."""
+        key = (sources,) if isinstance(sources, int) else tuple(sorted(set(sources)))
+        tree = self._trees.get(key)
+        if tree is not None:
+            self._trees.move_to_end(key)
+            self.hits += 1
+            return tree
+        self.misses += 1
+        tree = bfs_tree(self.graph, key)
+        self._trees[key] = tree
+        while len(self._trees) > self.capacity:
+            self._trees.popitem(last=False)
+            self.evictions += 1
+        return tree
+
+    def _cached_tree(self, source):
+        """The tree of source if cached or now worth caching, else None."""
+        key = (source,)
+        if key in self._trees:
+            return self.tree(source)
+        count = self._query_counts.get(source, 0) + 1
+        self._query_counts[source] = count
+        return self.tree(source) if count >= self.promote_after else None
+
+    def distance(self, source, target):
+        """Hop count from source to target, or None if unreachable."""
+        path = self.path(source, target)
+        return None if path is None else len(path) - 1
+
+    def connected(self, source, target):
+        """Whether target is reachable from source (by index on undirected graphs)."""
+        if self.directed:
+            return self.path(source, target) is not None
+        return self.connectivity().connected(source, target)
+
+    def connectivity(self):
+        """The connectivity index of the (undirected) graph, built on first use."""
+        if self._index is None:
+            self._index = ConnectivityIndex.from_graph(self.graph)
+        return self._index
+
+    def path(self, source, target):
+        """A shortest path from source to target, or None."""
+        if not self.directed and source != target and not self.connectivity().connected(source, target):
+            return None
+        tree = self._cached_tree(source)
+        if tree is not None:
+            distances, parents = tree
+            return None if distances[target] == UNREACHED else tree_path(parents, target)
+        if not self.directed and (target,) in self._trees:
+            distances, parents = self.tree(target)
+            if distances[target] == UNREACHED or distances[source] == UNREACHED:
+                return None
+            return tree_path(parents, source)[::-1]
+        return shortest_path(self.graph, source, target, self._reverse_graph())
+
+    def _reverse_graph(self):
+        if not self.directed:
+            return self.graph
+        if self._reverse is None:
+            self._reverse = {node: [] for node in range(len(self.graph))}
+            for node in range(len(self.graph)):
+                for neighbor in self.graph.get(node, ()):
+                    self._reverse[neighbor].append(node)
+        return self._reverse
+
+    def add_edge(self, u, v):
+        """Add edge u-v (u->v if directed) to the dict graph and drop cached trees."""
+        self.graph[u].append(v)
+        if not self.directed:
+            self.graph[v].append(u)
+        index = self._index
+        self.invalidate()
+        if index is not None and not self.directed:
+            # Insertions only merge components: keep the index up to date
+            index.add_edge(u, v)
+            self._index = index
+
+    def remove_edge(self, u, v):
+        """Remove edge u-v (u->v if directed) from the dict graph and drop cached trees."""
+        self.graph[u].remove(v)
+        if not self.directed:
+            self.graph[v].remove(u)
+        self.invalidate()
+
+    def invalidate(self):
+        """Forget every cached tree; call after changing the graph directly."""
+        self._trees.clear()
+        self._query_counts.clear()
+        self._reverse = None
+        self._index = None
+        self.invalidations += 1
+
+    def stats(self):
+        """Counters as a dict."""
+        return {
+            'trees': len(self._trees),
+            'capacity': self.capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+        }
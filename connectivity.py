@@ -0,0 +1,118 @@
+from array import array
+
+# Connected components of an undirected graph as disjoint sets, with union
+# by rank and path compression, so reachability checks cost O(alpha(n))
+# amortized and edges can be added one at a time as they arrive. Each set
+# also keeps its members on a circular linked list (next_member), which two
+# unions splice in O(1), so member lists cost only their own length.
+
+
+class DisjointSet:
+    """Union-find over the ints 0 .. n-1."""
+
+    def __init__(self, n):
+        self.parent = array('i', range(n))
+        self.rank = array('B', bytes(n))
+        self.sizes = array('i', [1]) * n
+        self.next_member = array('i', range(n))
+        self.count = n
+
+    def find(self, x):
+        """Root of x's set, halving the path on the way up."""
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        """Merge the sets of x and y; False if they were already one set."""
+        x = self.find(x)
+        y = self.find(y)
+        if x == y:
+            return False
+        if self.rank[x] < self.rank[y]:
+            x, y = y, x
+        self.parent[y] = x
+        if self.rank[x] == self.rank[y]:
+            self.rank[x] += 1
+        self.sizes[x] += self.sizes[y]
+        self.next_member[x], self.next_member[y] = self.next_member[y], self.next_member[x]
+        self.count -= 1
+        return True
+
+    def members(self, x):
+        """Every element in x's set, starting with x."""
+        members = [x]
+        member = self.next_member[x]
+        while member != x:
+            members.append(member)
+            member = self.next_member[member]
+        return members
+
+
+class ConnectivityIndex:
+    """
+    Which nodes of an undirected graph can reach each other. Component ids
+    are the sets' root nodes, so they can change when components merge.
+    """
+
+    def __init__(self, n):
+        self.sets = DisjointSet(n)
+
+    @classmethod
+    def from_graph(cls, graph, n=None):
+        """Index a dict of neighbor lists or CSRGraph over nodes 0 .. n-1."""
+        index = cls(len(graph) if n is None else n)
+        union = index.sets.union
+        for node, neighbors in graph.items():
+            for neighbor in neighbors:
+                union(node, neighbor)
+        return index
+
+    @classmethod
+    def from_edges(cls, n, edges):
+        index = cls(n)
+        union = index.sets.union
+        for u, v in edges:
+            union(u, v)
+        return index
+
+    def __len__(self):
+        return len(self.sets.parent)
+
+    def add_edge(self, u, v):
+        """Record a new edge; True if it joined two components."""
+        return self.sets.union(u, v)
+
+    def connected(self, u, v):
+        """Whether u can reach v."""
+        return self.sets.find(u) == self.sets.find(v)
+
+    def component(self, node):
+        """Id of node's component."""
+        return self.sets.find(node)
+
+    def size(self, node):
+        """Number of nodes in node's component."""
+        return self.sets.sizes[self.sets.find(node)]
+
+    def members(self, node):
+        """Nodes in node's component, ascending."""
+        return sorted(self.sets.members(node))
+
+    @property
+    def count(self):
+        """Number of components."""
+        return self.sets.count
+
+    def components(self):
+        """Every component as an ascending node list, ordered by smallest node."""
+        seen = set()
+        components = []
+        for node in range(len(self)):
+            root = self.sets.find(node)
+            if root not in seen:
+                seen.add(root)
+                components.append(self.members(node))
+        return components
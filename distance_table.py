@@ -0,0 +1,124 @@
+import mmap
+import os
+from collections import deque
+
+# Exhaustive table of optimal distances for the 8-puzzle. Every board is
+# mapped to its permutation rank (0 .. 9! - 1) and the table holds one byte
+# per rank: the number of moves to the goal, or UNREACHABLE for boards of the
+# wrong parity. Unsolvable ranks take half the table, which keeps the hash a
+# plain Lehmer code.
+
+GOAL_STATE = (1, 2, 3, 4, 5, 6, 7, 8, 0)
+CELLS = 9
+SIZE = 3
+UNREACHABLE = 255
+
+DISTANCE_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '8puzzle.dist')
+
+FACTORIALS = [1] * (CELLS + 1)
+for _i in range(1, CELLS + 1):
+    FACTORIALS[_i] = FACTORIALS[_i - 1] * _i
+
+
+def rank_permutation(board):
+    """Lehmer-code rank of a board in range(9!)."""
+    rank = 0
+    for i in range(CELLS):
+        tile = board[i]
+        smaller = 0
+        for j in range(i + 1, CELLS):
+            if board[j] < tile:
+                smaller += 1
+        rank += smaller * FACTORIALS[CELLS - 1 - i]
+    return rank
+
+
+def blank_moves(blank):
+    """Legal (direction, target cell) moves of the blank, in prac2.get_neighbors order."""
+    row, col = divmod(blank, SIZE)
+    moves = []
+    for direction, dr, dc in (('U', -1, 0), ('D', 1, 0), ('L', 0, -1), ('R', 0, 1)):
+        new_row, new_col = row + dr, col + dc
+        if 0 <= new_row < SIZE and 0 <= new_col < SIZE:
+            moves.append((direction, new_row * SIZE + new_col))
+    return moves
+
+
+BLANK_MOVES = [blank_moves(blank) for blank in range(CELLS)]
+
+
+def build_distance_table(path=DISTANCE_TABLE_PATH):
+    """Breadth-first search back from the goal over all 181,440 reachable boards."""
+    table = bytearray([UNREACHABLE]) * FACTORIALS[CELLS]
+    table[rank_permutation(GOAL_STATE)] = 0
+    queue = deque([(GOAL_STATE, CELLS - 1)])
+
+    while queue:
+        board, blank = queue.popleft()
+        distance = table[rank_permutation(board)] + 1
+        for _, target in BLANK_MOVES[blank]:
+            neighbor = list(board)
+            neighbor[blank], neighbor[target] = neighbor[target], 0
+            rank = rank_permutation(neighbor)
+            if table[rank] == UNREACHABLE:
+                table[rank] = distance
+                queue.append((tuple(neighbor), target))
+
+    with open(path, 'wb') as f:
+        f.write(table)
+    return table
+
+
+class DistanceTable:
+    """Read-only, memory-mapped view of a table written by build_distance_table."""
+
+    def __init__(self, path=DISTANCE_TABLE_PATH):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) != FACTORIALS[CELLS]:
+            raise ValueError(f"{path} is not an 8-puzzle distance table")
+
+    def distance(self, board):
+        """Optimal number of moves to the goal, or None if unsolvable."""
+        distance = self._map[rank_permutation(board)]
+        return None if distance == UNREACHABLE else distance
+
+    def solve(self, board):
+        """
+        Optimal move list (prac2 format: 'U', 'D', 'L', 'R') found by stepping
+        to a neighbor one move closer each time, O(depth). None if unsolvable.
+        """
+        distance = self.distance(board)
+        if distance is None:
+            return None
+
+        board = list(board)
+        blank = board.index(0)
+        path = []
+        while distance > 0:
+            for direction, target in BLANK_MOVES[blank]:
+                board[blank], board[target] = board[target], 0
+                if self._map[rank_permutation(board)] == distance - 1:
+                    path.append(direction)
+                    blank = target
+                    distance -= 1
+                    break
+                board[target], board[blank] = board[blank], 0
+            else:
+                raise ValueError("Distance table is inconsistent")
+        return path
+
+
+def load_distance_table(path=DISTANCE_TABLE_PATH):
+    """Return the DistanceTable at path, or None if it has not been built."""
+    if not os.path.exists(path):
+        return None
+    return DistanceTable(path)
+
+
+if __name__ == "__main__":
+    import sys
+
+    path = sys.argv[1] if len(sys.argv) > 1 else DISTANCE_TABLE_PATH
+    build_distance_table(path)
+    print(f"Distance table written to {path}")
@@ -0,0 +1,164 @@
+import mmap
+import os
+from itertools import islice
+
+import numpy as np
+
+from csr_graph import CSRGraph
+
+# Streaming edge-list reader for the graph scripts. Three formats:
+#   text    one "u v" pair per line, whitespace separated; '#' and '%' lines are comments
+#   csv     one "u,v" pair per line, with an optional header line
+#   binary  raw little-endian int32 pairs (u, v, u, v, ...), read through a memory map
+# Files are read chunk by chunk into (k, 2) int64 arrays, so the text never
+# has to fit in memory; only the parsed pairs are kept for building the graph.
+
+FORMATS = ('text', 'csv', 'binary')
+CHUNK_EDGES = 1 << 20
+
+BINARY_DTYPE = np.dtype('<i4')
+MAX_NODES = 2 ** 31
+
+
+def detect_format(path):
+    """Format from the file extension: .csv, .bin/.i32, anything else is text."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        return 'csv'
+    if extension in ('.bin', '.i32'):
+        return 'binary'
+    return 'text'
+
+
+def _text_chunks(path, separator, chunk_edges):
+    # Yields (edges, source line number of each edge)
+    with open(path) as f:
+        number = 0
+        while True:
+            lines = list(islice(f, chunk_edges))
+            if not lines:
+                return
+            values = []
+            numbers = []
+            for line in lines:
+                number += 1
+                if separator:
+                    line = line.replace(separator, ' ')
+                fields = line.split()
+                if not fields or fields[0][0] in '#%':
+                    continue
+                if number == 1 and separator and not fields[0].lstrip('-').isdigit():
+                    continue  # CSV header
+                if len(fields) != 2:
+                    raise ValueError(f"{path}: line {number} holds {len(fields)} fields, "
+                                     f"expected two node ids")
+                values.extend(fields)
+                numbers.append(number)
+            try:
+                edges = np.array(values, dtype=np.int64).reshape(-1, 2)
+            except ValueError:
+                bad = next((i for i, value in enumerate(values) if not value.lstrip('-').isdigit()), 0)
+                raise ValueError(f"{path}: line {numbers[bad // 2]} has a node id that is not "
+                                 f"an integer: {values[bad]!r}") from None
+            yield edges, np.array(numbers, dtype=np.int64)
+
+
+def _binary_chunks(path, chunk_edges):
+    # Yields (edges, None): binary files have no lines, edges are counted instead
+    size = os.path.getsize(path)
+    if size % (2 * BINARY_DTYPE.itemsize):
+        raise ValueError(f"{path}: size is not a whole number of int32 pairs")
+    if size == 0:
+        return
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            pairs = size // (2 * BINARY_DTYPE.itemsize)
+            for start in range(0, pairs, chunk_edges):
+                count = min(chunk_edges, pairs - start)
+                # Copied out at once: no view may outlive the map
+                yield np.frombuffer(data, dtype=BINARY_DTYPE, count=2 * count,
+                                    offset=2 * start * BINARY_DTYPE.itemsize
+                                    ).astype(np.int64).reshape(-1, 2), None
+
+
+def read_edge_chunks(path, format=None, n=None, chunk_edges=CHUNK_EDGES):
+    """
+    Yield the edges of path as (k, 2) int64 arrays of at most chunk_edges
+    rows. Text lines must hold exactly two ids, and every node id is checked
+    to be in 0 .. n-1 (or to fit an int32); errors name the file line
+    (the edge number for binary files).
+    """
+    format = format or detect_format(path)
+    if format == 'text':
+        chunks = _text_chunks(path, None, chunk_edges)
+    elif format == 'csv':
+        chunks = _text_chunks(path, ',', chunk_edges)
+    elif format == 'binary':
+        chunks = _binary_chunks(path, chunk_edges)
+    else:
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+
+    # Without n, ids only have to fit the int32 node arrays
+    limit = MAX_NODES if n is None else n
+    seen = 0
+    for chunk, numbers in chunks:
+        if chunk.size:
+            bad = np.flatnonzero(((chunk < 0) | (chunk >= limit)).any(axis=1))
+            if bad.size:
+                u, v = chunk[bad[0]]
+                where = f"edge {seen + bad[0] + 1}" if numbers is None else f"line {numbers[bad[0]]}"
+                raise ValueError(f"{path}: {where} ({u} {v}) is not in range 0 to {limit - 1}")
+        seen += len(chunk)
+        yield chunk
+
+
+def dedupe_edges(edges, directed=False):
+    """Drop repeated edges, keeping first occurrences in order; (u, v) == (v, u) if undirected."""
+    if not len(edges):
+        return edges
+    pairs = edges if directed else np.sort(edges, axis=1)
+    # One int64 key per edge: much faster to sort than rows
+    keys = (pairs[:, 0].astype(np.int64) << 32) | pairs[:, 1]
+    _, first = np.unique(keys, return_index=True)
+    return edges[np.sort(first)]
+
+
+def read_edges(path, format=None, n=None, dedupe=False, directed=False,
+               chunk_edges=CHUNK_EDGES):
+    """All edges of path as one (m, 2) int32 array (see read_edge_chunks)."""
+    parts = [chunk.astype(np.int32) for chunk in read_edge_chunks(path, format, n, chunk_edges)]
+    edges = np.concatenate(parts) if parts else np.empty((0, 2), dtype=np.int32)
+    if dedupe:
+        edges = dedupe_edges(edges, directed)
+    return edges
+
+
+def load_graph(path, n=None, format=None, directed=False, dedupe=False,
+               chunk_edges=CHUNK_EDGES):
+    """
+    Load an edge-list file as a CSRGraph over nodes 0 .. n-1. Without n the
+    node count is one more than the largest id in the file.
+    """
+    edges = read_edges(path, format, n, dedupe, directed, chunk_edges)
+    if n is None:
+        n = int(edges.max()) + 1 if len(edges) else 0
+    return CSRGraph.from_arrays(n, edges[:, 0], edges[:, 1], directed)
+
+
+def write_binary_edges(path, edges):
+    """Write (u, v) pairs in the binary int32 format."""
+    np.asarray(edges, dtype=BINARY_DTYPE).reshape(-1, 2).tofile(path)
+
+
+def add_arguments(parser):
+    """Edge-file options shared by the graph scripts' command lines."""
+    parser.add_argument("edges", nargs="?", help="edge-list file (prompts for edges if omitted)")
+    parser.add_argument("-n", "--nodes", type=int, help="number of nodes (default: largest id + 1)")
+    parser.add_argument("-f", "--format", choices=FORMATS, help="file format (default: from extension)")
+    parser.add_argument("--directed", action="store_true", help="edges are one-way")
+    parser.add_argument("--dedupe", action="store_true", help="drop repeated edges")
+
+
+def load_from_args(args):
+    """The graph named on a command line parsed with add_arguments's options."""
+    return load_graph(args.edges, args.nodes, args.format, args.directed, args.dedupe)
@@ -0,0 +1,198 @@
+import contextlib
+import json
+import math
+import os
+import platform
+import resource
+import sys
+import time
+
+import numpy as np
+
+import bfs as bfs_script
+import prac1
+from adjacency_matrix import DENSE_LIMIT, BitMatrix, SparseMatrix
+from csr_graph import CSRGraph
+from graph_traversal import iter_dfs
+from level_bfs import level_bfs
+
+# Scaling benchmark for the graph scripts. Seeded generators produce edge
+# arrays of a requested size; for each graph the harness times building the
+# dict of lists the scripts use and a CSRGraph, each traversal, and the
+# adjacency matrices, and writes one JSON line per measurement with edges
+# per second and the process's peak RSS so far.
+
+GENERATORS = ('erdos-renyi', 'grid', 'power-law', 'path')
+
+
+def erdos_renyi(edges, seed=0, average_degree=8):
+    """G(n, m) random graph: m edges between uniformly random endpoints."""
+    n = max(2, 2 * edges // average_degree)
+    rng = np.random.default_rng(seed)
+    return n, rng.integers(0, n, edges), rng.integers(0, n, edges)
+
+
+def grid(edges, seed=0):
+    """Square 4-neighbour grid with about the requested number of edges."""
+    side = max(2, math.isqrt(edges // 2))
+    nodes = np.arange(side * side).reshape(side, side)
+    sources = np.concatenate((nodes[:, :-1].ravel(), nodes[:-1, :].ravel()))
+    destinations = np.concatenate((nodes[:, 1:].ravel(), nodes[1:, :].ravel()))
+    return side * side, sources, destinations
+
+
+def power_law(edges, seed=0, exponent=2.5, average_degree=8):
+    """
+    Chung-Lu style graph: endpoints drawn with probability proportional to
+    weights i^(-1 / (exponent - 1)), giving a power-law degree distribution.
+    """
+    n = max(2, 2 * edges // average_degree)
+    rng = np.random.default_rng(seed)
+    weights = np.arange(1, n + 1) ** (-1.0 / (exponent - 1))
+    cumulative = np.cumsum(weights / weights.sum())
+    cumulative[-1] = 1.0
+    sources = np.searchsorted(cumulative, rng.random(edges), side='right')
+    destinations = np.searchsorted(cumulative, rng.random(edges), side='right')
+    # Shuffle ids so the hubs are not simply the lowest-numbered nodes
+    labels = rng.permutation(n)
+    return n, labels[sources], labels[destinations]
+
+
+def long_path(edges, seed=0):
+    """A single path of edges + 1 nodes, visited in a shuffled id order."""
+    n = edges + 1
+    order = np.random.default_rng(seed).permutation(n)
+    return n, order[:-1], order[1:]
+
+
+def generate(name, edges, seed=0):
+    """(n, sources, destinations) for one of GENERATORS."""
+    return {
+        'erdos-renyi': erdos_renyi,
+        'grid': grid,
+        'power-law': power_law,
+        'path': long_path,
+    }[name](edges, seed)
+
+
+def recursive_dfs(graph, start_node, visited=None, traversal_order=None):
+    """The original recursive prac1.dfs, kept as the baseline for the path case."""
+    if visited is None:
+        visited = set()
+        traversal_order = []
+    visited.add(start_node)
+    traversal_order.append(start_node)
+    for neighbor in graph.get(start_node, []):
+        if neighbor not in visited:
+            recursive_dfs(graph, neighbor, visited, traversal_order)
+    return traversal_order
+
+
+def peak_rss_kb():
+    """Peak resident set size of this process so far, in KiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak  # bytes on macOS
+
+
+def measure(record, phase, implementation, edges, function):
+    """
+    Time function() and return a result record. Errors, in particular the
+    RecursionError of a recursive DFS on a long path, are recorded rather
+    than raised.
+    """
+    result = dict(record, phase=phase, implementation=implementation)
+    start = time.perf_counter()
+    value = None
+    try:
+        # The scripts print progress lines; keep them out of the results
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            value = function()
+    except (RecursionError, MemoryError) as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    elapsed = time.perf_counter() - start
+    result['time'] = round(elapsed, 6)
+    result['edges_per_second'] = round(edges / elapsed) if elapsed else None
+    result['peak_rss_kb'] = peak_rss_kb()
+    return result, value
+
+
+def run_graph(name, edges, seed=0, dict_graph=True, matrix=True):
+    """Benchmark one generated graph; yields one record per measurement."""
+    n, sources, destinations = generate(name, edges, seed)
+    record = {'generator': name, 'nodes': n, 'edges': len(sources), 'seed': seed}
+    stored = 2 * len(sources)  # undirected: both directions are traversed
+    start = int(sources[0]) if len(sources) else 0
+
+    result, graph = measure(record, 'build', 'csr', stored,
+                            lambda: CSRGraph.from_arrays(n, sources, destinations))
+    yield result
+
+    traversals = [
+        ('bfs-csr', lambda: bfs_script.bfs(graph, start)),
+        ('level-bfs-csr', lambda: level_bfs(graph, start)),
+        ('iter-dfs-csr', lambda: list(iter_dfs(graph, start))),
+    ]
+    if dict_graph:
+        def build_dict():
+            adjacency = {i: [] for i in range(n)}
+            for u, v in zip(sources.tolist(), destinations.tolist()):
+                adjacency[u].append(v)
+                adjacency[v].append(u)
+            return adjacency
+
+        result, adjacency = measure(record, 'build', 'dict', stored, build_dict)
+        yield result
+        traversals += [
+            ('bfs-dict', lambda: bfs_script.bfs(adjacency, start)),
+            ('dfs-dict', lambda: prac1.dfs(adjacency, start)),
+            ('recursive-dfs-dict', lambda: recursive_dfs(adjacency, start)),
+        ]
+
+    for implementation, function in traversals:
+        result, _ = measure(record, 'traversal', implementation, stored, function)
+        yield result
+
+    if matrix:
+        if n * ((n + 7) // 8) <= DENSE_LIMIT:
+            result, _ = measure(record, 'matrix', 'bit', stored,
+                                lambda: BitMatrix.from_graph(graph, n))
+            yield result
+        result, _ = measure(record, 'matrix', 'sparse', stored,
+                            lambda: SparseMatrix.from_graph(graph, n))
+        yield result
+
+
+def main(argv=None):
+    """Command-line entry point: JSON lines, one per measurement."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark graph building, traversal and matrices.")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("-g", "--generator", action="append", choices=GENERATORS,
+                        help="graph family (repeatable, default: all)")
+    parser.add_argument("-e", "--edges", type=lambda s: int(float(s)), action="append",
+                        help="edge count, e.g. 1e6 (repeatable, default: 1e4 1e5 1e6)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-dict", action="store_true",
+                        help="skip the dict-of-lists graph (for very large inputs)")
+    parser.add_argument("--no-matrix", action="store_true", help="skip the adjacency matrices")
+    args = parser.parse_args(argv)
+
+    # The recursive baseline should fail with RecursionError, not crash the process
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10000))
+
+    outfile = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        for name in args.generator or GENERATORS:
+            for edges in args.edges or [10 ** 4, 10 ** 5, 10 ** 6]:
+                for result in run_graph(name, edges, args.seed, not args.no_dict, not args.no_matrix):
+                    result['python'] = platform.python_version()
+                    outfile.write(json.dumps(result) + "\n")
+                    outfile.flush()
+    finally:
+        if outfile is not sys.stdout:
+            outfile.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+from collections import deque
+
+# Lazy graph traversals. Both generators take the same graphs as bfs.py and
+# prac1.py (a dict of neighbor lists or a csr_graph.CSRGraph) and yield
+# nodes as they are visited, so callers can stop early just by leaving the
+# loop; nothing is built up beyond the visited set and the queue or stack.
+#
+# With events=True they yield (event, node) pairs instead: PRE when a node
+# is first visited and POST once all of its neighbors have been handled.
+
+PRE = 'pre'
+POST = 'post'
+
+
+def iter_bfs(graph, start_node, visited=None, events=False):
+    """
+    Breadth-first traversal from start_node, yielding nodes in the order bfs
+    lists them. A visited set may be passed in (and is updated) to skip
+    nodes or to continue across several starts.
+    """
+    visited = set() if visited is None else visited
+    if start_node in visited:
+        return
+    visited.add(start_node)
+    queue = deque([start_node])
+    yield (PRE, start_node) if events else start_node
+
+    while queue:
+        node = queue.popleft()
+        for neighbor in graph.get(node, ()):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append(neighbor)
+                yield (PRE, neighbor) if events else neighbor
+        if events:
+            yield POST, node
+
+
+def iter_dfs(graph, start_node, visited=None, events=False):
+    """
+    Depth-first traversal from start_node in the same order as the recursive
+    prac1.dfs, but with an explicit stack of neighbor iterators, so paths of
+    any length are fine. visited works as in iter_bfs.
+    """
+    visited = set() if visited is None else visited
+    if start_node in visited:
+        return
+    visited.add(start_node)
+    yield (PRE, start_node) if events else start_node
+    stack = [(start_node, iter(graph.get(start_node, ())))]
+
+    while stack:
+        node, neighbors = stack[-1]
+        for neighbor in neighbors:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                yield (PRE, neighbor) if events else neighbor
+                stack.append((neighbor, iter(graph.get(neighbor, ()))))
+                break
+        else:
+            stack.pop()
+            if events:
+                yield POST, node
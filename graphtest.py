@@ -1,5 +1,9 @@
+import sys
 from collections import deque
 
+from adjacency_matrix import adjacency_matrix
+from edge_loader import load_graph
+
 
 dq = deque("abcdef")
 
@@ -15,26 +19,31 @@ print(dq)
 
 
 #graph creation
-graph = {}
-n = int(input("Enter number of Nodes in the graph: "))
-for i in range(n):
-    graph[i] = []
-print(graph)
-print("Empty Graph initialized")
-e = int(input("Enter number of Edges in the graph: "))
-
-for i in range(e):
-    print(f"Enter edge {i+1} (source destination):")
-    edge = input().split()
-
-    u = int(edge[0])
-    v = int(edge[1])
+if len(sys.argv) > 1:
+    # Edge-list file given on the command line (see edge_loader for the formats)
+    graph = load_graph(sys.argv[1])
+    n = len(graph)
+else:
+    graph = {}
+    n = int(input("Enter number of Nodes in the graph: "))
+    for i in range(n):
+        graph[i] = []
+    print(graph)
+    print("Empty Graph initialized")
+    e = int(input("Enter number of Edges in the graph: "))
+
+    for i in range(e):
+        print(f"Enter edge {i+1} (source destination):")
+        edge = input().split()
+
+        u = int(edge[0])
+        v = int(edge[1])
     
-    if 0 <= u < n and 0 <= v <=n:
-        graph[u].append(v)
-        graph[v].append(u)
-    else:
-        print(f"Input not in range  0 to {n-1}")
+        if 0 <= u < n and 0 <= v <=n:
+            graph[u].append(v)
+            graph[v].append(u)
+        else:
+            print(f"Input not in range  0 to {n-1}")
 
 print("Graph Created.")
 print("Adjacency List:")
@@ -42,26 +51,16 @@ print(graph)
 
 
 #adjacency matrix
+# One bit per cell (or a sparse matrix for large n) instead of n x n ints,
+# filled in bulk; the graph already lists every edge in both directions
 
-adj_matrix = []
-for i in range(n):
-    row = []
-    for j in range (n):
-        row.append(0)
-    adj_matrix.append(row)
+adj_matrix = adjacency_matrix(graph, n)
 
 print("Adjacency matrix initialized")
 print(adj_matrix)
 
-##populating the matrix
-
-for node, neighbours in graph.items():
-    for n in neighbours:
-        adj_matrix[node][n] = 1
-        adj_matrix[n][node] = 1
-
 print("Populated Adjacency Matrix:")
-for row in adj_matrix:
+for row in adj_matrix.rows():
     print(row)
 
 
@@ -1,3 +1,9 @@
+import heapq
+import time
+from bisect import bisect_right
+
+import numpy as np
+
 class Item:
     def __init__(self, item_id, weight, value):
         self.item_id = item_id
@@ -42,6 +48,152 @@ def solve_knapsack_zero_one(capacity, items):
 
     return total_value, selected_items
 
+# Items per block whose take bits are kept at once when reconstructing in
+# linear space; 64 items of bits cost about as much as one DP row
+LEAF_ITEMS = 64
+
+# solve_knapsack uses the plain table up to TABLE_LIMIT cells, then the NumPy
+# engine while its decision bits fit in BITS_LIMIT bytes. Past that, the
+# vectorized linear-space solver takes instances up to LINEAR_LIMIT cells
+# whose checkpoint rows also fit in BITS_LIMIT bytes, and branch and bound
+# the rest, stopped after SEARCH_SECONDS with its gap reported.
+TABLE_LIMIT = 10_000_000
+BITS_LIMIT = 256 * 1024 * 1024
+SEARCH_SECONDS = 30
+# The vectorized linear-space solver measured about 8 ns per cell (n x
+# capacity, all passes included) for 200-2,000 items and capacities of
+# 250,000-2,500,000; this keeps it to about SEARCH_SECONDS
+NS_PER_LINEAR_CELL = 8
+LINEAR_LIMIT = SEARCH_SECONDS * 1_000_000_000 // NS_PER_LINEAR_CELL
+
+def _advance_row(row, items, lo, hi, takes=None):
+    # Roll a DP row for items[:lo] forward, in place, to one for items[:hi].
+    # Going down in w lets each item read the previous row's values. If takes
+    # is a list, it gets each item's take bits: bit w is set when including
+    # the item is strictly better at capacity w, i.e. dp[i][w] != dp[i-1][w].
+    capacity = len(row) - 1
+    for i in range(lo, hi):
+        item_weight = items[i].weight
+        item_value = items[i].value
+        taken = bytearray(capacity // 8 + 1) if takes is not None else None
+        for w in range(capacity, max(item_weight, 1) - 1, -1):
+            value_if_included = item_value + row[w - item_weight]
+            if value_if_included > row[w]:
+                row[w] = value_if_included
+                if taken is not None:
+                    taken[w >> 3] |= 1 << (w & 7)
+        if takes is not None:
+            takes.append(taken)
+
+def _advance_row_numpy(row, items, lo, hi, takes=None):
+    # _advance_row on an int64 NumPy row, one shifted elementwise maximum per
+    # item as in solve_knapsack_zero_one_numpy; take bits are packed the same
+    # way as _advance_row's (bit w is bit w & 7 of byte w >> 3).
+    capacity = len(row) - 1
+    take = np.zeros(capacity + 1, dtype=bool) if takes is not None else None
+    for i in range(lo, hi):
+        item = items[i]
+        low = max(item.weight, 1)
+        if low <= capacity:
+            value_if_included = row[low - item.weight:capacity + 1 - item.weight] + item.value
+            if take is not None:
+                take[:low] = False
+                np.greater(value_if_included, row[low:], out=take[low:])
+            np.maximum(row[low:], value_if_included, out=row[low:])
+        elif take is not None:
+            take[:] = False
+        if takes is not None:
+            takes.append(np.packbits(take, bitorder='little'))
+
+def _reconstruct(items, lo, hi, row, w, selected, leaf_items, advance=_advance_row):
+    # Backtrack items[lo:hi] from capacity w, given the DP row for items[:lo].
+    # Appends the chosen items (last item first) and returns the capacity left.
+    if hi - lo <= leaf_items:
+        takes = []
+        advance(row.copy(), items, lo, hi, takes)
+        for i in range(hi - 1, lo - 1, -1):
+            if takes[i - lo][w >> 3] >> (w & 7) & 1:
+                selected.append(items[i])
+                w -= items[i].weight
+        return w
+
+    # Divide and conquer: the upper half needs only the row at mid
+    mid = (lo + hi) // 2
+    mid_row = row.copy()
+    advance(mid_row, items, lo, mid)
+    w = _reconstruct(items, mid, hi, mid_row, w, selected, leaf_items, advance)
+    del mid_row
+    return _reconstruct(items, lo, mid, row, w, selected, leaf_items, advance)
+
+def solve_knapsack_zero_one_linear(capacity, items, leaf_items=LEAF_ITEMS, vectorized=False):
+    # Same result as solve_knapsack_zero_one, including the chosen items and
+    # their order, without the (n+1) x (capacity+1) table: one DP row per
+    # level of a divide-and-conquer over the items plus the take bits of one
+    # leaf block, O(capacity * log(n)) memory for O(n * capacity * log(n)) time.
+    #
+    # A Hirschberg split over the capacity would need only O(capacity), but it
+    # picks its own optimal set: where several sets tie, it need not be the
+    # one the table backtrack takes. That backtrack decides each item, last
+    # first, from the row just before it, so those rows are kept as
+    # checkpoints instead, one per halving of the items down to leaf_items:
+    # ceil(log2(n / leaf_items)) + 2 rows at most, e.g. 10 for 10,000 items.
+    #
+    # With vectorized=True the rows are int64 NumPy arrays updated as in
+    # solve_knapsack_zero_one_numpy, which makes the log(n) passes affordable
+    # for large instances; values must then fit in int64.
+    if vectorized:
+        if sum(item.value for item in items) > np.iinfo(np.int64).max:
+            raise OverflowError("total value does not fit in int64; use vectorized=False")
+        row, advance = np.zeros(capacity + 1, dtype=np.int64), _advance_row_numpy
+    else:
+        row, advance = [0] * (capacity + 1), _advance_row
+    selected_items = []
+    _reconstruct(items, 0, len(items), row, capacity, selected_items, leaf_items, advance)
+    total_value = sum(item.value for item in selected_items)
+    return total_value, selected_items
+
+def _checkpoint_rows(n, leaf_items=LEAF_ITEMS):
+    # Most DP rows solve_knapsack_zero_one_linear holds at once: one per
+    # halving of the items down to a leaf, plus the first row and the leaf's copy
+    rows = 2
+    while n > leaf_items:
+        n = (n + 1) // 2
+        rows += 1
+    return rows
+
+def solve_knapsack_zero_one_numpy(capacity, items):
+    # Same result as solve_knapsack_zero_one with each item's row update done
+    # as one shifted elementwise maximum over an int64 NumPy row. Decisions are
+    # kept as packed bits (n x (capacity+1) / 8 bytes) for the backtrack.
+    if sum(item.value for item in items) > np.iinfo(np.int64).max:
+        raise OverflowError("total value does not fit in int64; use solve_knapsack_zero_one")
+    n = len(items)
+    row = np.zeros(capacity + 1, dtype=np.int64)
+    take = np.zeros(capacity + 1, dtype=bool)
+    decisions = np.zeros((n, capacity // 8 + 1), dtype=np.uint8)
+
+    for i, item in enumerate(items):
+        # Column 0 is never updated, as in the table version
+        low = max(item.weight, 1)
+        if low > capacity:
+            continue
+        value_if_included = row[low - item.weight:capacity + 1 - item.weight] + item.value
+        take[:low] = False
+        np.greater(value_if_included, row[low:], out=take[low:])
+        np.maximum(row[low:], value_if_included, out=row[low:])
+        decisions[i] = np.packbits(take)
+
+    total_value = int(row[capacity])
+
+    selected_items = []
+    w = capacity
+    for i in range(n - 1, -1, -1):
+        if decisions[i, w >> 3] >> (7 - (w & 7)) & 1:
+            selected_items.append(items[i])
+            w -= items[i].weight
+
+    return total_value, selected_items
+
 def solve_knapsack_fractional(capacity, items):
     #sort by value per weight ratio
     items.sort(key=lambda x: x.value/x.weight, reverse=True)
@@ -67,6 +219,107 @@ def solve_knapsack_fractional(capacity, items):
     
     return total_value, selected_items
 
+def _ratio(item):
+    # Value per unit weight; weightless items come first
+    return item.value / item.weight if item.weight else float('inf')
+
+def solve_knapsack_branch_and_bound(capacity, items, best_first=True, node_limit=None,
+                                    time_limit=None):
+    # Exact 0/1 knapsack by branch and bound, for capacities too large for a
+    # DP table or real-valued weights: running time depends on the items, not
+    # the capacity. Items are taken in ratio order and each node is bounded
+    # by the greedy fractional solution of the rest (solve_knapsack_fractional).
+    # Nodes are explored best-first (highest bound) or depth-first.
+    #
+    # Returns (total_value, selected_items, gap), items in reverse input order
+    # as in solve_knapsack_zero_one. gap is the most any better solution could
+    # add: 0 when the search finished, otherwise the bound left when the
+    # node_limit or time_limit (seconds) stopped it.
+    order = sorted(range(len(items)), key=lambda i: _ratio(items[i]), reverse=True)
+    weights = [items[i].weight for i in order]
+    values = [items[i].value for i in order]
+    n = len(order)
+    # Integer values and weights: bounds are rounded down in exact integer
+    # arithmetic (a float bound loses precision past 2**53 and could prune
+    # the optimal branch)
+    integral = all(isinstance(x, int) for x in values + weights)
+
+    # Prefix sums let a node's fractional bound be found by bisection
+    prefix_weight = [0] * (n + 1)
+    prefix_value = [0] * (n + 1)
+    for k in range(n):
+        prefix_weight[k + 1] = prefix_weight[k] + weights[k]
+        prefix_value[k + 1] = prefix_value[k] + values[k]
+
+    def bound(k, value, room):
+        # Greedy fill of items k.. into room, the last one fractionally
+        j = bisect_right(prefix_weight, prefix_weight[k] + room, k) - 1
+        result = value + prefix_value[j] - prefix_value[k]
+        if j < n:
+            rest = room - (prefix_weight[j] - prefix_weight[k])
+            if integral:
+                result += values[j] * rest // weights[j]
+            else:
+                result += values[j] * rest / weights[j]
+        return result
+
+    # Incumbent: greedy in ratio order, skipping items that do not fit
+    best_value = 0
+    best_taken = None  # linked list of (ratio-order index, rest)
+    room = capacity
+    for k in range(n):
+        if weights[k] <= room:
+            room -= weights[k]
+            best_value += values[k]
+            best_taken = (k, best_taken)
+
+    # Node: (k, value, room, taken) with items before k decided
+    root_bound = bound(0, 0, capacity)
+    open_nodes = [(-root_bound, 0, 0, 0, capacity, None)]
+    push = heapq.heappush if best_first else list.append
+    pop = heapq.heappop if best_first else list.pop
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    tiebreak = 1
+    nodes = 0
+
+    while open_nodes:
+        if node_limit is not None and nodes >= node_limit:
+            break
+        if deadline is not None and nodes % 256 == 0 and time.perf_counter() > deadline:
+            break
+        negative_bound, _, k, value, room, taken = pop(open_nodes)
+        if -negative_bound <= best_value:
+            continue
+        nodes += 1
+
+        # Take item k first (searched first depth-first), then leave it
+        children = []
+        if k < n and weights[k] <= room:
+            children.append((k + 1, value + values[k], room - weights[k], (k, taken)))
+        if k < n:
+            children.append((k + 1, value, room, taken))
+        for child in reversed(children) if not best_first else children:
+            child_k, child_value, child_room, child_taken = child
+            if child_value > best_value:
+                best_value = child_value
+                best_taken = child_taken
+            if child_k < n:
+                child_bound = bound(child_k, child_value, child_room)
+                if child_bound > best_value:
+                    push(open_nodes, (-child_bound, tiebreak, child_k, child_value,
+                                      child_room, child_taken))
+                    tiebreak += 1
+
+    remaining = max((-node[0] for node in open_nodes), default=best_value)
+    gap = max(remaining - best_value, 0)
+
+    chosen = []
+    while best_taken is not None:
+        k, best_taken = best_taken
+        chosen.append(order[k])
+    selected_items = [items[i] for i in sorted(chosen, reverse=True)]
+    return best_value, selected_items, gap
+
 def solve_knapsack():
     capacity = int(input("Enter the capacity of the knapsack: "))
     items = create_items()
@@ -89,7 +342,19 @@ def solve_knapsack():
     print(f"Total Weight (Fractional): {total_weight:.1f}")
 
     print("\n Zero/One (0/1) Approach:")
-    optimal_value, optimal_items = solve_knapsack_zero_one(capacity, items)
+    if (len(items) + 1) * (capacity + 1) <= TABLE_LIMIT:
+        optimal_value, optimal_items = solve_knapsack_zero_one(capacity, items)
+    elif len(items) * (capacity // 8 + 1) <= BITS_LIMIT:
+        optimal_value, optimal_items = solve_knapsack_zero_one_numpy(capacity, items)
+    elif ((len(items) + 1) * (capacity + 1) <= LINEAR_LIMIT
+          and 8 * (capacity + 1) * _checkpoint_rows(len(items)) <= BITS_LIMIT):
+        optimal_value, optimal_items = solve_knapsack_zero_one_linear(capacity, items, vectorized=True)
+    else:
+        optimal_value, optimal_items, gap = solve_knapsack_branch_and_bound(
+            capacity, items, time_limit=SEARCH_SECONDS)
+        if gap:
+            print(f"Search stopped after {SEARCH_SECONDS}s: the optimum may be up to {gap} higher "
+                  f"than the value below")
     
     print("\nSelected Items (0/1):")
     total_weight = 0
@@ -0,0 +1,106 @@
+import numpy as np
+
+from csr_graph import CSRGraph
+
+# Level-synchronous, direction-optimizing breadth-first search over a
+# CSRGraph. Each level is expanded with whole-array NumPy operations on
+# boolean node masks instead of one node at a time:
+#
+#   top-down   gather the neighbors of every frontier node, keep unvisited ones
+#   bottom-up  for every unvisited node, check whether any neighbor is in the
+#              frontier
+#
+# Top-down costs the edges out of the frontier (m_f), bottom-up those into
+# the unvisited nodes (m_u). As in Beamer et al., the search goes bottom-up
+# once m_f > m_u / alpha and back to top-down when the frontier shrinks
+# below n / beta; that typically makes the large middle levels bottom-up.
+
+UNREACHED = -1
+
+
+def _edge_index(offsets, nodes):
+    """Indices into the neighbor array of every edge of nodes, plus per-node edge counts."""
+    starts = offsets[nodes]
+    counts = offsets[nodes + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64), counts
+    # Start of each node's run, shifted back by where that run begins in the output
+    shift = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return shift + np.arange(total), counts
+
+
+def _arrays(graph):
+    """The offsets and neighbor arrays of a CSRGraph as NumPy views."""
+    return (np.frombuffer(graph.offsets, dtype=np.int64),
+            np.frombuffer(graph.targets, dtype=np.int32))
+
+
+def level_bfs(graph, sources, directed=False, alpha=14, beta=24, directions=None):
+    """
+    BFS levels from one start node or a list of them. graph is a CSRGraph
+    or a dict of neighbor lists (converted first). Returns an int32 array
+    holding each node's level (0 for the sources), or UNREACHED; the nodes
+    with a level are exactly the nodes bfs visits.
+
+    Bottom-up steps need each node's in-neighbors; for directed graphs
+    (directed=True) the reversed graph is built for this. If a list is
+    passed as directions, 'top-down' or 'bottom-up' is appended per level.
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_adjacency(graph)
+    n = len(graph)
+    offsets, targets = _arrays(graph)
+    if directed:
+        sources_of = np.repeat(np.arange(n, dtype=np.int64), np.diff(offsets))
+        reverse = CSRGraph.from_arrays(n, targets, sources_of, directed=True)
+        in_offsets, in_targets = _arrays(reverse)
+    else:
+        in_offsets, in_targets = offsets, targets
+    degrees = np.diff(offsets)
+    in_degrees = np.diff(in_offsets)
+
+    levels = np.full(n, UNREACHED, dtype=np.int32)
+    visited = np.zeros(n, dtype=bool)
+    frontier = np.unique(np.atleast_1d(np.asarray(sources, dtype=np.int64)))
+    if frontier.size and (frontier[0] < 0 or frontier[-1] >= n):
+        raise ValueError(f"start nodes must be in range 0 to {n - 1}")
+    visited[frontier] = True
+    levels[frontier] = 0
+
+    unvisited_edges = int(in_degrees.sum()) - int(in_degrees[frontier].sum())
+    bottom_up = False
+    level = 0
+    while frontier.size:
+        level += 1
+        frontier_edges = int(degrees[frontier].sum())
+        if not bottom_up and frontier_edges * alpha > unvisited_edges:
+            bottom_up = True
+        elif bottom_up and frontier.size * beta < n:
+            bottom_up = False
+
+        if bottom_up:
+            in_frontier = np.zeros(n, dtype=bool)
+            in_frontier[frontier] = True
+            candidates = np.flatnonzero(~visited)
+            edges, counts = _edge_index(in_offsets, candidates)
+            owner = np.repeat(np.arange(candidates.size), counts)
+            found = np.bincount(owner[in_frontier[in_targets[edges]]], minlength=candidates.size)
+            frontier = candidates[found > 0]
+        else:
+            edges, _ = _edge_index(offsets, frontier)
+            neighbors = targets[edges]
+            frontier = np.unique(neighbors[~visited[neighbors]])
+
+        visited[frontier] = True
+        levels[frontier] = level
+        unvisited_edges -= int(in_degrees[frontier].sum())
+        if directions is not None and frontier.size:
+            directions.append('bottom-up' if bottom_up else 'top-down')
+    return levels
+
+
+def visited_nodes(levels):
+    """The nodes reached, level by level (ascending ids within a level)."""
+    reached = np.flatnonzero(levels != UNREACHED)
+    return reached[np.argsort(levels[reached], kind='stable')]
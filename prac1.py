@@ -1,12 +1,24 @@
 from collections import deque
 
-def bfs(graph, start_node):
+from csr_graph import CSRGraph
+from edge_loader import add_arguments, load_from_args
+from graph_traversal import iter_dfs
+
+def bfs(graph, start_node, stats=None):
+    # stats: optional search_stats.SearchStats to collect counters and timings
+    if stats is not None:
+        stats.mark()
     queue = deque([start_node])  
     visited = {start_node}  
     traversal_order = [start_node]  
 
     print("Starting BFS from node:", start_node)
+    if stats is None and isinstance(graph, CSRGraph) and start_node in graph:
+        # Same order from a loop over the flat arrays
+        return graph.bfs_order(start_node)
     while queue:
+        if stats is not None:
+            stats.frontier(len(queue))
         current_node = queue.popleft()
 
         for neighbor in graph.get(current_node, []):
@@ -15,43 +27,50 @@ def bfs(graph, start_node):
                 queue.append(neighbor)
                 traversal_order.append(neighbor) 
 
+    if stats is not None:
+        # Every visited node was queued, popped and expanded exactly once;
+        # every other neighbor seen was a duplicate
+        visited_count = len(traversal_order)
+        generated = sum(len(graph.get(node, [])) for node in traversal_order)
+        stats.add(expansions=visited_count, pushes=visited_count, pops=visited_count,
+                  generated=generated, duplicates=generated - visited_count + 1)
+        stats.lap('search')
     return traversal_order
 
-def dfs(graph, start_node, visited=None, traversal_order=None):
+def dfs(graph, start_node, visited=None, traversal_order=None, stats=None):
     if visited is None:
         visited = set()
         traversal_order = []
         print("Starting DFS from node:", start_node)
+    if stats is not None:
+        stats.mark()
     
-    visited.add(start_node)
-    traversal_order.append(start_node)
-    
-    for neighbor in graph.get(start_node, []):
-        if neighbor not in visited:
-            dfs(graph, neighbor, visited, traversal_order)
+    # Explicit stack (see graph_traversal), so long paths cannot overflow
+    # the recursion limit; the visit order is the same as recursing
+    visited.discard(start_node)
+    first = len(traversal_order)
+    traversal_order.extend(iter_dfs(graph, start_node, visited))
     
+    if stats is not None:
+        found = len(traversal_order) - first
+        generated = sum(len(graph.get(node, [])) for node in traversal_order[first:])
+        stats.add(expansions=found, generated=generated, duplicates=generated - found + 1)
+        stats.lap('search')
     return traversal_order
 
 def print_adjacency_matrix(graph, n):
     print("\nGraph Adjacency Matrix:")
-    matrix = [[0 for _ in range(n)] for _ in range(n)]
-    
-    for node in graph:
-        for neighbor in graph[node]:
-            matrix[node][neighbor] = 1
-    
-    print("   ", end="")
-    for i in range(n):
-        print(f"{i}", end=" ")
-    print()
+    # Rows are built and printed one at a time, so memory is O(n), not O(n^2)
+    # (adjacency_matrix has compact matrices that can be kept)
+    print("   " + "".join(f"{i} " for i in range(n)))
     
     for i in range(n):
-        print(f"{i}", end="  ")
-        for j in range(n):
-            print(f"{matrix[i][j]}", end=" ")
-        print()
+        row = bytearray(b"0 " * n)
+        for neighbor in graph.get(i, []):
+            row[2 * neighbor] = ord("1")
+        print(f"{i}  " + row.decode())
 
-def main():
+def read_graph():
     graph = {}
     n = int(input("Enter number of Nodes in the graph: "))
     for i in range(n):
@@ -76,8 +95,26 @@ def main():
     print("Graph Created.")
     print("Adjacency List:")
     print(graph)
-    
-    print_adjacency_matrix(graph, n)
+    return graph, n
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="BFS and DFS traversals of a graph.")
+    add_arguments(parser)
+    parser.add_argument("--matrix", action="store_true",
+                        help="print the adjacency matrix of a graph loaded from a file")
+    args = parser.parse_args(argv)
+
+    if args.edges:
+        graph = load_from_args(args)
+        n = len(graph)
+        print(f"Graph loaded from {args.edges}: {n} nodes, {graph.num_edges} adjacency entries")
+        if args.matrix:
+            print_adjacency_matrix(graph, n)
+    else:
+        graph, n = read_graph()
+        print_adjacency_matrix(graph, n)
 
     while True:
         print("\nMenu:")
@@ -1,104 +1,443 @@
 import heapq
+import math
+import time
+from array import array
+
+from distance_table import load_distance_table
+from puzzle_heuristics import ManhattanHeuristic
+from search_stats import SearchStats
 
 # Define goal state as a global constant
 GOAL_STATE = [1, 2, 3, 4, 5, 6, 7, 8, 0]
 
+# Goal boards and goal (row, col) tables per board width, built on first use
+_GOAL_STATES = {3: GOAL_STATE}
+_GOAL_COORDINATES = {}
+_BLANK_MOVES = {}
+_MANHATTAN = {}
+
+def board_size(board):
+    # Boards are flat lists of size * size tiles
+    return math.isqrt(len(board))
+
+def goal_state(size):
+    if size not in _GOAL_STATES:
+        _GOAL_STATES[size] = list(range(1, size * size)) + [0]
+    return _GOAL_STATES[size]
+
+def goal_coordinates(size):
+    # goal_rows[tile], goal_cols[tile] for every tile of the size x size goal
+    if size not in _GOAL_COORDINATES:
+        goal_rows = [0] * (size * size)
+        goal_cols = [0] * (size * size)
+        for pos, tile in enumerate(goal_state(size)):
+            goal_rows[tile], goal_cols[tile] = divmod(pos, size)
+        _GOAL_COORDINATES[size] = (goal_rows, goal_cols)
+    return _GOAL_COORDINATES[size]
+
 def manhattan_distance(board):
+    size = board_size(board)
+    goal_rows, goal_cols = goal_coordinates(size)
     distance = 0
-    for i in range(9):
+    for i in range(len(board)):
         if board[i] != 0:
-            current_row, current_col = divmod(i, 3)
-            goal_pos = GOAL_STATE.index(board[i])
-            goal_row, goal_col = divmod(goal_pos, 3)
-            distance += abs(current_row - goal_row) + abs(current_col - goal_col)
+            current_row, current_col = divmod(i, size)
+            distance += abs(current_row - goal_rows[board[i]]) + abs(current_col - goal_cols[board[i]])
     return distance
 
+def manhattan_heuristic(size):
+    # Incremental Manhattan heuristic for the size x size goal (see puzzle_heuristics)
+    if size not in _MANHATTAN:
+        _MANHATTAN[size] = ManhattanHeuristic(goal_state(size))
+    return _MANHATTAN[size]
+
+def evaluator(heuristic, size):
+    # Returns child_h(parent_h, child, tile, from_pos, to_pos) for a heuristic.
+    # Heuristics with update() are evaluated incrementally, plain callables in full.
+    if heuristic is None:
+        heuristic = manhattan_heuristic(size)
+    update = getattr(heuristic, 'update', None)
+    if update is not None:
+        return heuristic, update
+    return heuristic, lambda value, board, tile, from_pos, to_pos: heuristic(board)
+
 def count_inversions(board):
-    inversions = 0 
-    # Get positions of each number in both current and goal states (excluding 0)
-    current_positions = {}
-    goal_positions = {}
-    
-    for i in range(9):
-        if board[i] != 0:
-            current_positions[board[i]] = i
-        if GOAL_STATE[i] != 0:
-            goal_positions[GOAL_STATE[i]] = i
+    # Inversions of the board relative to the goal order (excluding 0),
+    # counted with a bottom-up merge sort in O(n log n)
+    goal = goal_state(board_size(board))
+    goal_order = {tile: i for i, tile in enumerate(goal)}
+    sequence = [goal_order[x] for x in board if x != 0]
     
-    numbers = [x for x in GOAL_STATE if x != 0]
-    for i in range(len(numbers)):
-        for j in range(i + 1, len(numbers)):
-            num1, num2 = numbers[i], numbers[j]
-            if current_positions[num1] > current_positions[num2]:
-                inversions += 1
+    inversions = 0
+    width = 1
+    while width < len(sequence):
+        merged = []
+        for start in range(0, len(sequence), 2 * width):
+            left = sequence[start:start + width]
+            right = sequence[start + width:start + 2 * width]
+            i = j = 0
+            while i < len(left) and j < len(right):
+                if left[i] <= right[j]:
+                    merged.append(left[i])
+                    i += 1
+                else:
+                    # Every number still waiting on the left is larger
+                    merged.append(right[j])
+                    inversions += len(left) - i
+                    j += 1
+            merged.extend(left[i:])
+            merged.extend(right[j:])
+        sequence = merged
+        width *= 2
     
     return inversions
 
 def is_solvable(board):
+    size = board_size(board)
+    goal = goal_state(size)
     board_inversions = count_inversions(board)
-    goal_inversions = count_inversions(GOAL_STATE)
-    return board_inversions % 2 == goal_inversions % 2
+    goal_inversions = count_inversions(goal)
+    if size % 2 == 1:
+        return board_inversions % 2 == goal_inversions % 2
+    # Even width: each vertical move flips the inversion parity and moves the
+    # blank one row, so inversions plus the blank's row keeps its parity
+    board_row = board.index(0) // size
+    goal_row = goal.index(0) // size
+    return (board_inversions + board_row) % 2 == (goal_inversions + goal_row) % 2
 
 def get_neighbors(board):
     neighbors = []
+    size = board_size(board)
     blank_pos = board.index(0)
-    row, col = divmod(blank_pos, 3)
+    row, col = divmod(blank_pos, size)
     
     # Define possible moves: (direction, row_change, col_change)
     moves = [('U', -1, 0), ('D', 1, 0), ('L', 0, -1), ('R', 0, 1)]
     
     for direction, dr, dc in moves:
         new_row, new_col = row + dr, col + dc
-        if 0 <= new_row < 3 and 0 <= new_col < 3:
-            new_pos = new_row * 3 + new_col
+        if 0 <= new_row < size and 0 <= new_col < size:
+            new_pos = new_row * size + new_col
             new_board = board[:]
             new_board[blank_pos], new_board[new_pos] = new_board[new_pos], new_board[blank_pos]
             neighbors.append((new_board, direction))
     
     return neighbors
 
+def blank_move_table(size):
+    # For every blank position, the (move code, new blank position) pairs in
+    # get_neighbors order; move codes are ord() of the direction letters
+    if size not in _BLANK_MOVES:
+        table = []
+        for blank_pos in range(size * size):
+            board = [1] * (size * size)
+            board[blank_pos] = 0
+            table.append([(ord(direction), new_board.index(0))
+                          for new_board, direction in get_neighbors(board)])
+        _BLANK_MOVES[size] = table
+    return _BLANK_MOVES[size]
+
 def print_board(board):
-    for i in range(0, 9, 3):
-        print(' '.join('_' if x == 0 else str(x) for x in board[i:i+3]))
+    size = board_size(board)
+    for i in range(0, len(board), size):
+        print(' '.join('_' if x == 0 else str(x) for x in board[i:i+size]))
     print()
 
-def a_star(start):
-    open_list = [(manhattan_distance(start), 0, start, [])]
+def arena_path(parents, moves, node):
+    # Rebuild the move list of a node by following parent indices to the root
+    path = []
+    while parents[node] != -1:
+        path.append(chr(moves[node]))
+        node = parents[node]
+    return path[::-1]
+
+def path_precedes(parents, moves, parent, move, node):
+    # True if path(parent) + [move] sorts before path(node). Both paths have the
+    # same length; walking up together, the difference nearest the root decides.
+    precedes = False
+    other_parent, other_move = parents[node], moves[node]
+    while True:
+        if move != other_move:
+            precedes = move < other_move
+        if parent == other_parent:
+            return precedes
+        parent, move = parents[parent], moves[parent]
+        other_parent, other_move = parents[other_parent], moves[other_parent]
+
+def a_star(start, heuristic=None, stats=None):
+    # heuristic: any callable taking a flat board (see puzzle_heuristics);
+    # defaults to an incrementally updated Manhattan distance.
+    # stats: optional search_stats.SearchStats to collect counters and timings
+    if stats is not None:
+        stats.mark()
+    size = board_size(start)
+    heuristic, child_h = evaluator(heuristic, size)
+    goal = tuple(goal_state(size))
+    
+    # Node arena: node i has parent parents[i] and was reached by move chr(moves[i]).
+    # Heap entries carry a node index instead of a copy of the whole path.
+    parents = array('i', [-1])
+    moves = bytearray(1)
+    blank_moves = blank_move_table(size)
+    start = tuple(start)
+    open_list = [(heuristic(start), 0, start, 0)]
+    # (g, node) of the best queued entry for every board not yet closed
+    best = {start: (0, 0)}
     closed = set()
+    path = None
+    pops = generated = duplicates = peak = 0
+    trace = stats.trace if stats is not None else None
+    if stats is not None:
+        stats.lap('setup')
     
     while open_list:
-        f_cost, g_cost, current, path = heapq.heappop(open_list)
+        if stats is not None and len(open_list) > peak:
+            peak = len(open_list)
+        f_cost, g_cost, current, node = heapq.heappop(open_list)
+        pops += 1
         
-        if current == GOAL_STATE:
-            return path
+        if current == goal:
+            path = arena_path(parents, moves, node)
+            break
         
-        if tuple(current) in closed:
+        if current in closed:
             continue
-        closed.add(tuple(current))
+        closed.add(current)
+        del best[current]
+        if trace is not None:
+            trace('expand', current)
         
-        for neighbor, move in get_neighbors(current):
-            if tuple(neighbor) not in closed:
-                new_g = g_cost + 1
-                new_f = new_g + manhattan_distance(neighbor)
-                heapq.heappush(open_list, (new_f, new_g, neighbor, path + [move]))
+        new_g = g_cost + 1
+        h_cost = f_cost - g_cost
+        blank_pos = current.index(0)
+        for move, new_pos in blank_moves[blank_pos]:
+            generated += 1
+            neighbor = list(current)
+            tile = neighbor[new_pos]
+            neighbor[blank_pos], neighbor[new_pos] = tile, 0
+            key = tuple(neighbor)
+            if key in closed:
+                duplicates += 1
+                continue
+            
+            known = best.get(key)
+            if known is not None and known[0] <= new_g:
+                # Already queued at least as cheaply. On a tie keep whichever path
+                # sorts first, as the heap would when comparing whole paths.
+                known_g, known_node = known
+                if known_g == new_g and path_precedes(parents, moves, node, move, known_node):
+                    parents[known_node] = node
+                    moves[known_node] = move
+                duplicates += 1
+                continue
+            
+            child = len(parents)
+            parents.append(node)
+            moves.append(move)
+            best[key] = (new_g, child)
+            new_f = new_g + child_h(h_cost, key, tile, new_pos, blank_pos)
+            heapq.heappush(open_list, (new_f, new_g, key, child))
     
-    return None
+    if stats is not None:
+        # Every arena node, the start included, was pushed once
+        stats.add(expansions=len(closed), generated=generated, duplicates=duplicates,
+                  pushes=len(parents), pops=pops)
+        stats.frontier(peak)
+        stats.lap('search')
+    return path
+
+def anytime_a_star(start, weights=(5, 3, 2, 1.5, 1.25, 1), time_limit=None,
+                   node_limit=None, heuristic=None, stats=None):
+    # Anytime weighted A*: one weighted search (f = g + w * h) per weight, each
+    # pruned by the best solution so far, until the weights, time_limit
+    # (seconds) or node_limit run out. A generator yielding
+    # (path, cost, bound) after every finished step; bound is the proven ratio
+    # of cost to the optimal cost, 1.0 once the path is optimal.
+    # stats: optional search_stats.SearchStats; each yield is also traced as
+    # a 'solution' event with (cost, bound)
+    if stats is not None:
+        stats.mark()
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    size = board_size(start)
+    heuristic, child_h = evaluator(heuristic, size)
+    blank_moves = blank_move_table(size)
+    goal = tuple(goal_state(size))
+    start = tuple(start)
+    start_h = heuristic(start)
+    best_path = None
+    best_cost = None
+    nodes_expanded = 0
+    # Counts not yet passed to stats
+    expanded = generated = duplicates = pushes = pops = peak = 0
+    if stats is not None:
+        stats.lap('setup')
+
+    def record():
+        nonlocal expanded, generated, duplicates, pushes, pops
+        stats.add(expansions=expanded, generated=generated, duplicates=duplicates,
+                  pushes=pushes, pops=pops)
+        stats.frontier(peak)
+        stats.lap('search')
+        expanded = generated = duplicates = pushes = pops = 0
+
+    for weight in weights:
+        # Node arena as in a_star; heap entries are (weighted f, g, h, board, node)
+        parents = array('i', [-1])
+        moves = bytearray(1)
+        open_list = [(weight * start_h, 0, start_h, start, 0)]
+        best_g = {start: 0}
+        pushes += 1
+
+        while open_list:
+            if (deadline is not None and time.perf_counter() > deadline
+                    or node_limit is not None and nodes_expanded >= node_limit):
+                if stats is not None:
+                    record()
+                return
+
+            if stats is not None and len(open_list) > peak:
+                peak = len(open_list)
+            _, g_cost, h_cost, current, node = heapq.heappop(open_list)
+            pops += 1
+            if g_cost > best_g[current]:
+                continue
+            if best_cost is not None and g_cost + h_cost >= best_cost:
+                continue
+            if current == goal:
+                best_path, best_cost = arena_path(parents, moves, node), g_cost
+                break
+
+            nodes_expanded += 1
+            expanded += 1
+            new_g = g_cost + 1
+            blank_pos = current.index(0)
+            for move, new_pos in blank_moves[blank_pos]:
+                generated += 1
+                neighbor = list(current)
+                tile = neighbor[new_pos]
+                neighbor[blank_pos], neighbor[new_pos] = tile, 0
+                key = tuple(neighbor)
+                if new_g < best_g.get(key, new_g + 1):
+                    best_g[key] = new_g
+                    new_h = child_h(h_cost, key, tile, new_pos, blank_pos)
+                    parents.append(node)
+                    moves.append(move)
+                    pushes += 1
+                    heapq.heappush(open_list, (new_g + weight * new_h, new_g, new_h, key, len(parents) - 1))
+                else:
+                    duplicates += 1
+
+        if best_path is None:
+            if stats is not None:
+                record()
+            return
+
+        # Any cheaper solution must pass through a live open node
+        lower_bound = best_cost
+        for _, g_cost, h_cost, board, _ in open_list:
+            if g_cost == best_g[board] and g_cost + h_cost < lower_bound:
+                lower_bound = g_cost + h_cost
+        bound = best_cost / lower_bound if lower_bound else 1.0
+
+        if stats is not None:
+            record()
+            stats.event('solution', (best_cost, bound))
+        yield best_path, best_cost, bound
+        if stats is not None:
+            stats.mark()  # time spent by the caller is not search time
+        if bound <= 1.0:
+            return
+
+def ida_star(start, heuristic=None, stats=None):
+    # Iterative deepening A*: only the current path is held in memory.
+    # stats: optional search_stats.SearchStats. Children over the threshold
+    # count as cutoffs, and each finished iteration is traced as an
+    # 'iteration' event with (threshold, nodes_expanded).
+    # The thresholds would rise forever on a board of the wrong parity
+    if not is_solvable(start):
+        return None
+    if stats is not None:
+        stats.mark()
+    size = board_size(start)
+    heuristic, child_h = evaluator(heuristic, size)
+    blank_moves = blank_move_table(size)
+    goal = goal_state(size)
+    start_h = heuristic(start)
+    threshold = start_h
+    path = []
+    on_path = {tuple(start)}
+    nodes_expanded = generated = duplicates = 0
+    iterations = 0
+    trace = stats.trace if stats is not None else None
+    if stats is not None:
+        stats.lap('setup')
+
+    def search(board, g_cost, h_cost):
+        nonlocal nodes_expanded, generated, duplicates
+        f_cost = g_cost + h_cost
+        if f_cost > threshold:
+            return f_cost
+        nodes_expanded += 1
+        if trace is not None:
+            trace('expand', board)
+        if board == goal:
+            return True
+        next_threshold = None
+        blank_pos = board.index(0)
+        for move, new_pos in blank_moves[blank_pos]:
+            generated += 1
+            neighbor = board[:]
+            tile = neighbor[new_pos]
+            neighbor[blank_pos], neighbor[new_pos] = tile, 0
+            key = tuple(neighbor)
+            if key in on_path:
+                duplicates += 1
+                continue
+            on_path.add(key)
+            path.append(chr(move))
+            result = search(neighbor, g_cost + 1, child_h(h_cost, neighbor, tile, new_pos, blank_pos))
+            if result is True:
+                return True
+            path.pop()
+            on_path.discard(key)
+            if result is not None and (next_threshold is None or result < next_threshold):
+                next_threshold = result
+        return next_threshold
+
+    while True:
+        expanded_before = nodes_expanded
+        result = search(start, 0, start_h)
+        iterations += 1
+        if stats is not None:
+            stats.event('iteration', (threshold, nodes_expanded - expanded_before))
+        if result is True or result is None:
+            break
+        threshold = result
+
+    if stats is not None:
+        # Every search() call not expanded was cut off by the threshold: one
+        # call per root and per child not already on the path
+        stats.add(expansions=nodes_expanded, generated=generated, duplicates=duplicates,
+                  cutoffs=iterations + generated - duplicates - nodes_expanded)
+        stats.frontier(len(path))
+        stats.lap('search')
+    return path if result is True else None
 
 def get_user_input():
     print("Enter the initial puzzle state:")
-    print("Use numbers 1-8 and 0 for the blank space")
-    print("Enter 9 numbers separated by spaces (row by row):")
+    print("Use numbers 1-8 and 0 for the blank space (1-15 or 1-24 for larger boards)")
+    print("Enter 9, 16 or 25 numbers separated by spaces (row by row):")
     
     while True:
         try:
             user_input = input("Enter puzzle state: ").strip().split() 
-            if len(user_input) != 9:
-                print("Error: Please enter exactly 9 numbers.")
+            if len(user_input) not in (9, 16, 25):
+                print("Error: Please enter exactly 9, 16 or 25 numbers.")
                 continue
             # Convert to integers
             puzzle = [int(x) for x in user_input]
-            if sorted(puzzle) != list(range(9)):
-                print("Error: Please use numbers 0-8 exactly once each.")
+            if sorted(puzzle) != list(range(len(puzzle))):
+                print(f"Error: Please use numbers 0-{len(puzzle) - 1} exactly once each.")
                 continue          
             return puzzle
         except ValueError:
@@ -108,11 +447,15 @@ def get_user_input():
 def display_menu():
     print("== 8 Puzzle Solver ==")
     print("1. Input puzzle state")
-    print("2. Quit")
+    print("2. Input puzzle state (IDA*, low memory)")
+    print("3. Input puzzle state (A*, without the distance table)")
+    print("4. Quit")
 
 
-def solve_puzzle(initial_state):
-    if initial_state == GOAL_STATE:
+def solve_puzzle(initial_state, use_ida=False, table=None):
+    # table: a distance_table.DistanceTable answering 8-puzzles without search,
+    # unless use_ida asks for IDA*
+    if initial_state == goal_state(board_size(initial_state)):
         print("Puzzle is already solved!")
         print_board(initial_state)
         return
@@ -122,7 +465,21 @@ def solve_puzzle(initial_state):
         return
     
     print("Puzzle is solvable. Finding solution...")
-    solution = a_star(initial_state)
+    if table is not None and not use_ida and len(initial_state) == 9:
+        # Precomputed 8-puzzle distances: walk straight down to the goal
+        solution = table.solve(initial_state)
+    elif use_ida:
+        iterations = []
+        stats = SearchStats(trace=lambda event, data: iterations.append(data) if event == 'iteration' else None)
+        solution = ida_star(initial_state, stats=stats)
+        print(f"Nodes expanded: {stats.expansions}")
+        for threshold, expanded in iterations:
+            print(f"  threshold {threshold}: {expanded} nodes expanded")
+    else:
+        stats = SearchStats()
+        solution = a_star(initial_state, stats=stats)
+        print(f"Nodes expanded: {stats.expansions} (peak open list {stats.peak_frontier}, "
+              f"{stats.phases['search']:.3f}s)")
 
     if solution:
         print(f"Solution found in {len(solution)} moves:")
@@ -142,25 +499,28 @@ def solve_puzzle(initial_state):
         print("No solution exists.")
 
 if __name__ == "__main__":
+    # Built with `python distance_table.py`; option 1 falls back to A* if missing
+    table = load_distance_table()
     while True:
         display_menu()      
         try:
-            choice = input("Enter your choice (1-2): ").strip()         
-            if choice == '1':
+            choice = input("Enter your choice (1-4): ").strip()         
+            if choice in ('1', '2', '3'):
                 initial_state = get_user_input()
                 print("\nYou entered:")
                 print_board(initial_state)
                 
                 confirm = input("Is this correct? (y/n): ").strip().lower()
                 if confirm == 'y':
-                    solve_puzzle(initial_state)
+                    solve_puzzle(initial_state, use_ida=(choice == '2'),
+                                 table=table if choice == '1' else None)
                 else:
                     print("Please try again.")        
-            elif choice == '2':
+            elif choice == '4':
                 print("Thank you for using 8-Puzzle Solver!")
                 break            
             else:
-                print("Invalid choice. Please enter 1 or 2.")              
+                print("Invalid choice. Please enter 1, 2, 3 or 4.")              
         except KeyboardInterrupt:
             print("\n\nQuitting..")
             break
\ No newline at end of file
@@ -0,0 +1,160 @@
+import importlib
+import json
+import math
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import prac2
+from distance_table import DISTANCE_TABLE_PATH, DistanceTable
+from puzzle_heuristics import PatternDatabaseHeuristic
+
+# 8puzzle.py is not a valid identifier, so it cannot be imported by name
+puzzle8 = importlib.import_module('8puzzle')
+
+METHODS = ('astar', 'ida', 'table')
+
+
+# Per-process solver settings, filled in by _init_worker
+_worker = {}
+
+
+def parse_board(line):
+    """Parse one board: tiles separated by spaces or commas, row by row."""
+    tiles = [int(token) for token in line.replace(',', ' ').split()]
+    size = math.isqrt(len(tiles))
+    if size < 2 or size * size != len(tiles):
+        raise ValueError(f"expected a square number of tiles, got {len(tiles)}")
+    if sorted(tiles) != list(range(len(tiles))):
+        raise ValueError(f"tiles must be 0-{len(tiles) - 1} exactly once each")
+    return tiles
+
+
+def _init_worker(method, pdb_path, table_path):
+    """Load shared tables once per worker process (both are memory-mapped)."""
+    _worker['method'] = method
+    _worker['heuristic'] = PatternDatabaseHeuristic(pdb_path) if pdb_path else None
+    _worker['table'] = DistanceTable(table_path) if method == 'table' else None
+
+
+def _solve_board(board):
+    """Solve one board in a worker; returns the fields of its result line."""
+    method = _worker['method']
+    heuristic = _worker['heuristic']
+    if heuristic is not None and heuristic.cells != len(board):
+        heuristic = None  # pattern database built for another board size
+
+    start = time.perf_counter()
+    if method == 'table' and len(board) == 9:
+        moves = _worker['table'].solve(board)
+        nodes_expanded = 0
+    else:
+        puzzle = puzzle8.Puzzle8(board, heuristic=heuristic)
+        if method == 'ida':
+            solution, nodes_expanded, _ = puzzle.solve_ida_star()
+        else:
+            solution, nodes_expanded, _ = puzzle.solve()
+        moves = [puzzle8.MOVE_LETTERS[move] for _, move in solution[1:]]
+    elapsed = time.perf_counter() - start
+
+    return {
+        'moves': ''.join(moves),
+        'depth': len(moves),
+        'nodes_expanded': nodes_expanded,
+        'time': round(elapsed, 6),
+    }
+
+
+def _result(pending):
+    """
+    Turn a pending entry into its output record, waiting if needed. A board
+    whose solve raised gets an error field, like a line that did not parse.
+    """
+    record, future = pending
+    if future is not None:
+        try:
+            record.update(future.result())
+        except Exception as e:
+            record['error'] = f"{type(e).__name__}: {e}"
+    return record
+
+
+def solve_stream(lines, workers=None, method='astar', pdb_path=None,
+                 table_path=DISTANCE_TABLE_PATH, window=None):
+    """
+    Solve boards read from lines across a process pool, yielding one result
+    dict per board in input order. At most window boards are in flight, so
+    memory stays flat however long the input is.
+    """
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {', '.join(METHODS)}")
+    workers = workers or os.cpu_count() or 1
+    window = window or workers * 4
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(method, pdb_path, table_path)) as pool:
+        pending = deque()
+        for line_number, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            record = {'line': line_number}
+            future = None
+            try:
+                board = parse_board(line)
+            except ValueError as e:
+                record['error'] = str(e)
+            else:
+                record['board'] = board
+                # Unsolvable boards are answered here and never reach a worker
+                record['solvable'] = prac2.is_solvable(board)
+                if record['solvable']:
+                    future = pool.submit(_solve_board, board)
+            pending.append((record, future))
+
+            while len(pending) >= window:
+                yield _result(pending.popleft())
+
+        while pending:
+            yield _result(pending.popleft())
+
+
+def main(argv=None):
+    """Command-line entry point: boards in, JSON lines out."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Solve sliding-puzzle boards in bulk.")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="file with one board per line (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("-w", "--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("-m", "--method", choices=METHODS, default="astar",
+                        help="A*, IDA* or the 8-puzzle distance table (default: astar)")
+    parser.add_argument("--pdb", help="pattern database file to use as the heuristic")
+    parser.add_argument("--table", default=DISTANCE_TABLE_PATH, help="8-puzzle distance table file")
+    args = parser.parse_args(argv)
+    # Workers load these in the pool initializer, where a missing file would
+    # only surface as a BrokenProcessPool
+    if args.method == 'table' and not os.path.exists(args.table):
+        parser.error(f"distance table {args.table} not found; build it with `python distance_table.py`")
+    if args.pdb and not os.path.exists(args.pdb):
+        parser.error(f"pattern database {args.pdb} not found")
+
+    infile = sys.stdin if args.input == "-" else open(args.input)
+    outfile = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        for result in solve_stream(infile, args.workers, args.method, args.pdb, args.table):
+            outfile.write(json.dumps(result) + "\n")
+            outfile.flush()
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+import importlib
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+import prac2
+from distance_table import BLANK_MOVES, GOAL_STATE
+from puzzle_heuristics import LinearConflictHeuristic, PatternDatabaseHeuristic
+from search_stats import SearchStats
+
+# 8puzzle.py is not a valid identifier, so it cannot be imported by name
+puzzle8 = importlib.import_module('8puzzle')
+
+# Benchmark of the 8-puzzle solvers. Instances come from a seeded sample of
+# boards at each optimal depth 0-31 and from the fixed corpora below; every
+# solver/heuristic pair is timed on each instance and the results, with
+# per-pair summaries, are written as one JSON document.
+
+MAX_DEPTH = 31  # the hardest 8-puzzle boards are 31 moves from the goal
+
+FIXED_CORPORA = {
+    # Boards often used in examples, from trivial to near worst case
+    'classic': [
+        (1, 2, 3, 4, 5, 6, 7, 8, 0),
+        (1, 2, 3, 4, 0, 6, 7, 5, 8),
+        (0, 1, 3, 4, 2, 5, 7, 8, 6),
+        (8, 1, 3, 4, 0, 2, 7, 6, 5),
+        (7, 2, 4, 5, 0, 6, 8, 3, 1),
+        (8, 7, 6, 5, 4, 3, 2, 1, 0),
+    ],
+    # The only two boards at depth 31
+    'hardest': [
+        (8, 6, 7, 2, 5, 4, 3, 0, 1),
+        (6, 4, 7, 8, 5, 0, 3, 2, 1),
+    ],
+}
+
+
+def _puzzle8_astar(board, heuristic):
+    stats = SearchStats()
+    solution, _, _ = puzzle8.Puzzle8(list(board), heuristic=heuristic).solve(stats=stats)
+    return len(solution) - 1, stats.expansions
+
+
+def _puzzle8_ida(board, heuristic):
+    stats = SearchStats()
+    solution, _, _ = puzzle8.Puzzle8(list(board), heuristic=heuristic).solve_ida_star(stats=stats)
+    return len(solution) - 1, stats.expansions
+
+
+def _prac2_astar(board, heuristic):
+    stats = SearchStats()
+    solution = prac2.a_star(list(board), heuristic, stats)
+    return len(solution), stats.expansions
+
+
+def _prac2_ida(board, heuristic):
+    stats = SearchStats()
+    solution = prac2.ida_star(list(board), heuristic, stats)
+    return len(solution), stats.expansions
+
+
+# Each solver takes (board, heuristic or None) and returns (moves, nodes expanded)
+SOLVERS = {
+    'puzzle8-astar': _puzzle8_astar,
+    'puzzle8-ida': _puzzle8_ida,
+    'prac2-astar': _prac2_astar,
+    'prac2-ida': _prac2_ida,
+}
+
+HEURISTICS = ('manhattan', 'linear-conflict', 'pdb')
+
+
+def make_heuristic(name, pdb_path=None):
+    """Heuristic object for name; None means the solver's own Manhattan distance."""
+    if name == 'manhattan':
+        return None
+    if name == 'linear-conflict':
+        return LinearConflictHeuristic()
+    if name == 'pdb':
+        if pdb_path is None:
+            raise ValueError("the pdb heuristic needs a pattern database path")
+        return PatternDatabaseHeuristic(pdb_path)
+    raise ValueError(f"heuristic must be one of {', '.join(HEURISTICS)}")
+
+
+def depth_index():
+    """Optimal depth of every solvable 8-puzzle board, by breadth-first search."""
+    depths = {GOAL_STATE: 0}
+    queue = deque([(GOAL_STATE, len(GOAL_STATE) - 1)])
+    while queue:
+        board, blank = queue.popleft()
+        depth = depths[board] + 1
+        for _, target in BLANK_MOVES[blank]:
+            neighbor = list(board)
+            neighbor[blank], neighbor[target] = neighbor[target], 0
+            neighbor = tuple(neighbor)
+            if neighbor not in depths:
+                depths[neighbor] = depth
+                queue.append((neighbor, target))
+    return depths
+
+
+def generate_corpus(per_depth=3, seed=0, depths=None, index=None):
+    """
+    Seeded sample of per_depth boards at each optimal depth (fewer where
+    fewer exist), as (depth, board) pairs in depth order.
+    """
+    index = index or depth_index()
+    buckets = [[] for _ in range(MAX_DEPTH + 1)]
+    for board, depth in index.items():
+        buckets[depth].append(board)
+
+    rng = random.Random(seed)
+    corpus = []
+    for depth in (range(MAX_DEPTH + 1) if depths is None else depths):
+        bucket = sorted(buckets[depth])
+        for board in rng.sample(bucket, min(per_depth, len(bucket))):
+            corpus.append((depth, board))
+    return corpus
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile (q in 0-100) of an ascending list."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-q * len(sorted_values) // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def run_instance(solver, board, heuristic, memory=False):
+    """
+    Time one solve. With memory=True the solve is repeated under tracemalloc
+    for its peak allocation, so tracing does not slow the timed run.
+    """
+    start = time.perf_counter()
+    moves, nodes = solver(board, heuristic)
+    elapsed = time.perf_counter() - start
+
+    peak_memory = None
+    if memory:
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        solver(board, heuristic)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        if not tracing:
+            tracemalloc.stop()
+    return moves, nodes, elapsed, peak_memory
+
+
+def summarize(records):
+    """Per solver/heuristic summary: latency percentiles, nodes/s, peak memory."""
+    groups = {}
+    for record in records:
+        groups.setdefault((record['solver'], record['heuristic']), []).append(record)
+
+    summary = []
+    for (solver, heuristic), group in groups.items():
+        times = sorted(record['time'] for record in group)
+        total_time = sum(times)
+        nodes = sum(record['nodes_expanded'] for record in group)
+        memory = [record['peak_memory'] for record in group if record['peak_memory'] is not None]
+        summary.append({
+            'solver': solver,
+            'heuristic': heuristic,
+            'instances': len(group),
+            'optimal': sum(record['optimal'] for record in group),
+            'total_time': round(total_time, 6),
+            'mean_time': round(total_time / len(group), 6),
+            'p50': round(percentile(times, 50), 6),
+            'p90': round(percentile(times, 90), 6),
+            'p99': round(percentile(times, 99), 6),
+            'max_time': round(times[-1], 6),
+            'nodes_expanded': nodes,
+            'nodes_per_second': round(nodes / total_time) if total_time else None,
+            'peak_memory': max(memory) if memory else None,
+        })
+    return summary
+
+
+def run_benchmark(instances, solvers=None, heuristics=('manhattan',), pdb_path=None,
+                  memory=False, progress=None):
+    """
+    Run every solver/heuristic pair on every (corpus, depth, board) instance.
+    Returns the per-instance records and their summary.
+    """
+    solvers = solvers or list(SOLVERS)
+    records = []
+    for heuristic_name in heuristics:
+        heuristic = make_heuristic(heuristic_name, pdb_path)
+        for solver_name in solvers:
+            solver = SOLVERS[solver_name]
+            for corpus, depth, board in instances:
+                moves, nodes, elapsed, peak_memory = run_instance(solver, board, heuristic, memory)
+                record = {
+                    'solver': solver_name,
+                    'heuristic': heuristic_name,
+                    'corpus': corpus,
+                    'board': list(board),
+                    'depth': depth,
+                    'moves': moves,
+                    'optimal': moves == depth,
+                    'nodes_expanded': nodes,
+                    'time': round(elapsed, 6),
+                    'nodes_per_second': round(nodes / elapsed) if elapsed else None,
+                    'peak_memory': peak_memory,
+                }
+                records.append(record)
+                if progress is not None:
+                    progress(record)
+    return records, summarize(records)
+
+
+def main(argv=None):
+    """Command-line entry point: run the benchmark and write JSON."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the 8-puzzle solvers.")
+    parser.add_argument("-o", "--output", default="-", help="JSON output file (default: stdout)")
+    parser.add_argument("-n", "--per-depth", type=int, default=3,
+                        help="generated boards per optimal depth (default: 3)")
+    parser.add_argument("--seed", type=int, default=0, help="generator seed (default: 0)")
+    parser.add_argument("--min-depth", type=int, default=0)
+    parser.add_argument("--max-depth", type=int, default=MAX_DEPTH)
+    parser.add_argument("--corpus", action="append", choices=sorted(FIXED_CORPORA),
+                        help="also run a fixed corpus (repeatable)")
+    parser.add_argument("-s", "--solver", action="append", choices=sorted(SOLVERS),
+                        help="solver to run (repeatable, default: all)")
+    parser.add_argument("-H", "--heuristic", action="append", choices=HEURISTICS,
+                        help="heuristic to use (repeatable, default: manhattan)")
+    parser.add_argument("--pdb", help="pattern database file for the pdb heuristic")
+    parser.add_argument("--memory", action="store_true",
+                        help="measure peak memory (runs each instance a second time)")
+    args = parser.parse_args(argv)
+
+    index = depth_index()
+    depths = range(args.min_depth, args.max_depth + 1)
+    instances = [('generated', depth, board)
+                 for depth, board in generate_corpus(args.per_depth, args.seed, depths, index)]
+    for name in args.corpus or []:
+        instances += [(name, index[board], board) for board in FIXED_CORPORA[name]]
+
+    def progress(record):
+        print(f"{record['solver']:>14} {record['heuristic']:>15} depth {record['depth']:2d} "
+              f"{record['nodes_expanded']:8d} nodes {record['time']:9.4f}s", file=sys.stderr)
+
+    records, summary = run_benchmark(instances, args.solver, args.heuristic or ['manhattan'],
+                                     args.pdb, args.memory, progress)
+    result = {
+        'meta': {
+            'seed': args.seed,
+            'per_depth': args.per_depth,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        },
+        'summary': summary,
+        'instances': records,
+    }
+
+    outfile = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        json.dump(result, outfile, indent=1)
+        outfile.write("\n")
+    finally:
+        if outfile is not sys.stdout:
+            outfile.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+import mmap
+import struct
+from collections import deque
+
+# A heuristic is any callable that takes a board as a flat sequence of tiles
+# in row-major order (0 for the blank) and returns an admissible estimate of
+# the number of moves to the goal. prac2.manhattan_distance already fits this
+# interface; Puzzle8(heuristic=...) and prac2.a_star(start, heuristic=...)
+# accept any such callable.
+#
+# Heuristics derived from Heuristic can also be evaluated incrementally:
+# update() gets the parent's value and the single tile that moved, so the
+# solvers never recompute the full sum for a child.
+
+GOAL_STATE = (1, 2, 3, 4, 5, 6, 7, 8, 0)
+
+PDB_MAGIC = b'PDB1'
+UNREACHED = 255
+
+# Disjoint tile groups used when no partition is given
+DEFAULT_PARTITIONS = {
+    3: ((1, 2, 3, 4), (5, 6, 7, 8)),
+    4: ((1, 2, 3, 5, 6), (4, 7, 8, 11, 12), (9, 10, 13, 14, 15)),
+    5: ((1, 2, 6, 7), (3, 4, 5, 8), (9, 10, 14, 15), (11, 12, 16, 17), (13, 18, 19, 20), (21, 22, 23, 24)),
+}
+
+
+def neighbor_table(size):
+    """Cells adjacent to every cell of a size x size board."""
+    table = []
+    for pos in range(size * size):
+        row, col = divmod(pos, size)
+        cells = []
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            new_row, new_col = row + dr, col + dc
+            if 0 <= new_row < size and 0 <= new_col < size:
+                cells.append(new_row * size + new_col)
+        table.append(cells)
+    return table
+
+
+def permutation_count(cells, k):
+    """Number of ways to place k distinct tiles on cells cells."""
+    count = 1
+    for i in range(k):
+        count *= cells - i
+    return count
+
+
+def rank_positions(positions, cells):
+    """Perfect hash of distinct cell positions into range(permutation_count)."""
+    rank = 0
+    for i, pos in enumerate(positions):
+        # Positions already used by earlier tiles are not available to this one
+        smaller = 0
+        for j in range(i):
+            if positions[j] < pos:
+                smaller += 1
+        rank = rank * (cells - i) + pos - smaller
+    return rank
+
+
+class Heuristic:
+    """Base class for heuristics that support incremental evaluation."""
+
+    def __call__(self, tiles):
+        """Full evaluation of a board."""
+        raise NotImplementedError
+
+    def update(self, value, tiles, tile, from_pos, to_pos):
+        """
+        Value for the child board tiles, reached from a parent whose value was
+        value by sliding tile from from_pos into the blank at to_pos.
+        Subclasses override this with an O(1) or O(width) delta.
+        """
+        return self(tiles)
+
+
+class ManhattanHeuristic(Heuristic):
+    """Sum of Manhattan distances of every tile from its goal cell."""
+
+    def __init__(self, goal=GOAL_STATE):
+        self.goal = tuple(goal)
+        self.size = int(round(len(self.goal) ** 0.5))
+        cells = len(self.goal)
+        # Goal row and column of every tile
+        self.goal_row = [0] * cells
+        self.goal_col = [0] * cells
+        for goal_pos, tile in enumerate(self.goal):
+            self.goal_row[tile], self.goal_col[tile] = divmod(goal_pos, self.size)
+        # Distance of every tile from every position, indexed [tile][pos]
+        self.table = [[0] * cells for _ in range(cells)]
+        for tile in range(1, cells):
+            for pos in range(cells):
+                row, col = divmod(pos, self.size)
+                self.table[tile][pos] = abs(row - self.goal_row[tile]) + abs(col - self.goal_col[tile])
+
+    def __call__(self, tiles):
+        table = self.table
+        return sum(table[tile][pos] for pos, tile in enumerate(tiles) if tile)
+
+    def update(self, value, tiles, tile, from_pos, to_pos):
+        distances = self.table[tile]
+        return value + distances[to_pos] - distances[from_pos]
+
+
+class LinearConflictHeuristic(ManhattanHeuristic):
+    """
+    Manhattan distance plus linear conflicts: two tiles in their goal row
+    (or column) but in reversed order must leave the line, costing two extra
+    moves. Per line the extra cost is 2 * (tiles in the line - longest run
+    already in goal order), which keeps the heuristic admissible.
+    """
+
+    def __init__(self, goal=GOAL_STATE):
+        super().__init__(goal)
+        size = self.size
+        self.rows = [[row * size + col for col in range(size)] for row in range(size)]
+        self.cols = [[row * size + col for row in range(size)] for col in range(size)]
+
+    def _line_conflicts(self, tiles, cells, line, goal_line, goal_index, undo=None):
+        """
+        Conflict count of one line. With undo=(tile, from_pos, to_pos) the line
+        is read from the parent board, where tile is still at from_pos.
+        """
+        sequence = []
+        for pos in cells:
+            tile = tiles[pos]
+            if undo is not None:
+                if pos == undo[1]:
+                    tile = undo[0]
+                elif pos == undo[2]:
+                    tile = 0
+            if tile and goal_line[tile] == line:
+                sequence.append(goal_index[tile])
+        if len(sequence) < 2:
+            return 0
+        # Longest increasing subsequence: the tiles that may stay in the line
+        longest = [1] * len(sequence)
+        for i in range(1, len(sequence)):
+            for j in range(i):
+                if sequence[j] < sequence[i] and longest[j] + 1 > longest[i]:
+                    longest[i] = longest[j] + 1
+        return len(sequence) - max(longest)
+
+    def __call__(self, tiles):
+        conflicts = 0
+        for line, cells in enumerate(self.rows):
+            conflicts += self._line_conflicts(tiles, cells, line, self.goal_row, self.goal_col)
+        for line, cells in enumerate(self.cols):
+            conflicts += self._line_conflicts(tiles, cells, line, self.goal_col, self.goal_row)
+        return super().__call__(tiles) + 2 * conflicts
+
+    def update(self, value, tiles, tile, from_pos, to_pos):
+        value = super().update(value, tiles, tile, from_pos, to_pos)
+        from_row, from_col = divmod(from_pos, self.size)
+        to_row, to_col = divmod(to_pos, self.size)
+        # The tile keeps its order in the line it slides along, so only the two
+        # perpendicular lines it leaves and enters can change
+        if from_row == to_row:
+            lines = ((self.cols, from_col, self.goal_col, self.goal_row),
+                     (self.cols, to_col, self.goal_col, self.goal_row))
+        else:
+            lines = ((self.rows, from_row, self.goal_row, self.goal_col),
+                     (self.rows, to_row, self.goal_row, self.goal_col))
+        for lines_of, line, goal_line, goal_index in lines:
+            cells = lines_of[line]
+            before = self._line_conflicts(tiles, cells, line, goal_line, goal_index,
+                                          (tile, from_pos, to_pos))
+            after = self._line_conflicts(tiles, cells, line, goal_line, goal_index)
+            value += 2 * (after - before)
+        return value
+
+
+def build_pattern_table(pattern, goal, size):
+    """
+    Retrograde 0-1 BFS from the goal for one group of tiles.
+    Only moves of pattern tiles are counted, so tables for disjoint
+    groups can be added together. Returns a bytearray indexed by
+    rank_positions of the pattern tiles' cells.
+    """
+    cells = size * size
+    adjacent = neighbor_table(size)
+    goal_pos = {tile: pos for pos, tile in enumerate(goal)}
+    entries = permutation_count(cells, len(pattern))
+
+    # Best known cost per (pattern placement, blank cell)
+    dist = bytearray([UNREACHED]) * (entries * cells)
+    start = tuple(goal_pos[tile] for tile in pattern)
+    blank = goal_pos[0]
+    dist[rank_positions(start, cells) * cells + blank] = 0
+    queue = deque([(start, blank, 0)])
+
+    while queue:
+        positions, blank, cost = queue.popleft()
+        if cost > dist[rank_positions(positions, cells) * cells + blank]:
+            continue
+        for target in adjacent[blank]:
+            if target in positions:
+                # A pattern tile slides into the blank: costs one move
+                moved = list(positions)
+                moved[positions.index(target)] = blank
+                new_positions, new_cost = tuple(moved), cost + 1
+            else:
+                # Only a don't-care tile moves: free in the abstraction
+                new_positions, new_cost = positions, cost
+            index = rank_positions(new_positions, cells) * cells + target
+            if new_cost < dist[index]:
+                dist[index] = new_cost
+                if new_cost == cost:
+                    queue.appendleft((new_positions, target, new_cost))
+                else:
+                    queue.append((new_positions, target, new_cost))
+
+    # The heuristic does not know where the blank is, so take the best case
+    table = bytearray(entries)
+    for rank in range(entries):
+        table[rank] = min(dist[rank * cells:(rank + 1) * cells])
+    return table
+
+
+def build_pattern_database(path, size=3, partition=None, goal=None):
+    """Build additive disjoint pattern databases and save them to path."""
+    if goal is None:
+        goal = tuple(range(1, size * size)) + (0,)
+    if partition is None:
+        partition = DEFAULT_PARTITIONS[size]
+
+    with open(path, 'wb') as f:
+        f.write(struct.pack('<4sBB', PDB_MAGIC, size, len(partition)))
+        f.write(bytes(goal))
+        for pattern in partition:
+            table = build_pattern_table(pattern, goal, size)
+            f.write(struct.pack('<B', len(pattern)))
+            f.write(bytes(pattern))
+            f.write(struct.pack('<I', len(table)))
+            f.write(table)
+
+
+class PatternDatabaseHeuristic(Heuristic):
+    """
+    Additive disjoint pattern database heuristic read from a file written by
+    build_pattern_database. The file is memory-mapped read-only, so worker
+    processes that open the same file share one copy through the page cache.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._map)
+
+        magic, self.size, pattern_count = struct.unpack_from('<4sBB', view, 0)
+        if magic != PDB_MAGIC:
+            raise ValueError(f"{path} is not a pattern database file")
+        offset = struct.calcsize('<4sBB')
+        self.cells = self.size * self.size
+        self.goal = tuple(view[offset:offset + self.cells])
+        offset += self.cells
+
+        self.patterns = []
+        for _ in range(pattern_count):
+            (k,) = struct.unpack_from('<B', view, offset)
+            offset += 1
+            tiles = tuple(view[offset:offset + k])
+            offset += k
+            (length,) = struct.unpack_from('<I', view, offset)
+            offset += 4
+            self.patterns.append((tiles, view[offset:offset + length]))
+            offset += length
+
+        # Which pattern every tile belongs to, for incremental updates
+        self.pattern_of = {}
+        for pattern in self.patterns:
+            for tile in pattern[0]:
+                self.pattern_of[tile] = pattern
+
+    def __call__(self, tiles):
+        cells = self.cells
+        where = [0] * cells
+        for pos, tile in enumerate(tiles):
+            where[tile] = pos
+        total = 0
+        for pattern, table in self.patterns:
+            total += table[rank_positions([where[tile] for tile in pattern], cells)]
+        return total
+
+    def update(self, value, tiles, tile, from_pos, to_pos):
+        if tile not in self.pattern_of:
+            return value
+        # Only the table of the moved tile's pattern changes
+        pattern, table = self.pattern_of[tile]
+        after = [tiles.index(t) for t in pattern]
+        before = [from_pos if t == tile else pos for t, pos in zip(pattern, after)]
+        return value + table[rank_positions(after, self.cells)] - table[rank_positions(before, self.cells)]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build an additive pattern database file.")
+    parser.add_argument("path", help="output file")
+    parser.add_argument("--size", type=int, default=3, help="board width (default 3)")
+    parser.add_argument("--partition", help="tile groups, e.g. '1,2,3,4;5,6,7,8'")
+    args = parser.parse_args()
+
+    partition = None
+    if args.partition:
+        partition = [tuple(int(t) for t in group.split(',')) for group in args.partition.split(';')]
+    build_pattern_database(args.path, args.size, partition)
+    print(f"Pattern database written to {args.path}")
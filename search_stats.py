@@ -0,0 +1,88 @@
+import json
+import time
+import tracemalloc
+
+# Shared instrumentation for the search scripts. Solvers take an optional
+# stats=SearchStats() argument; with the default None they do no extra work
+# beyond an "is not None" test, so uninstrumented runs keep their speed.
+#
+# Counters: expansions (nodes taken off the frontier and expanded), generated
+# (successors produced), duplicates (successors pruned as already seen),
+# pushes and pops (frontier operations), cutoffs (alpha-beta or bound
+# cutoffs), peak_frontier (largest frontier seen) and peak_memory (bytes, via
+# tracemalloc, only when memory=True). Phase times are in seconds.
+#
+# A trace callback receives ('expand', node) for every expansion of the A*
+# and IDA* puzzle searches, and these solver-level events: 'iteration' (IDA*, (threshold, nodes_expanded)),
+# 'meet' (bidirectional A*, the cost of a cheaper meeting) and 'solution'
+# (anytime A*, (cost, bound)).
+
+COUNTERS = ('expansions', 'generated', 'duplicates', 'pushes', 'pops', 'cutoffs')
+
+
+class SearchStats:
+    """Counters, phase timings and peak memory collected across searches."""
+
+    def __init__(self, trace=None, memory=False):
+        # trace: optional callable(event, data) called for every traced event
+        self.trace = trace
+        self.memory = memory
+        self.reset()
+
+    def reset(self):
+        """Zero every counter and phase time."""
+        for name in COUNTERS:
+            setattr(self, name, 0)
+        self.peak_frontier = 0
+        self.peak_memory = 0
+        self.phases = {}
+        self._last = time.perf_counter()
+
+    def add(self, **counts):
+        """Add to counters in one call, e.g. add(expansions=n, pushes=m)."""
+        for name, value in counts.items():
+            setattr(self, name, getattr(self, name) + value)
+
+    def frontier(self, size):
+        """Note the current frontier size, keeping the peak."""
+        if size > self.peak_frontier:
+            self.peak_frontier = size
+
+    def mark(self):
+        """Start the clock (and memory tracing) for the phases that follow."""
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        self._last = time.perf_counter()
+
+    def lap(self, phase):
+        """Charge the time since the last mark or lap to phase."""
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self._last
+        self._last = now
+        if self.memory and tracemalloc.is_tracing():
+            self.peak_memory = max(self.peak_memory, tracemalloc.get_traced_memory()[1])
+
+    def event(self, name, data=None):
+        """Pass an event to the trace callback, if there is one."""
+        if self.trace is not None:
+            self.trace(name, data)
+
+    def snapshot(self):
+        """All counters and phase times as a plain dict."""
+        snapshot = {name: getattr(self, name) for name in COUNTERS}
+        snapshot['peak_frontier'] = self.peak_frontier
+        snapshot['peak_memory'] = self.peak_memory
+        snapshot['phases'] = {phase: round(seconds, 6) for phase, seconds in self.phases.items()}
+        snapshot['time'] = round(sum(self.phases.values()), 6)
+        return snapshot
+
+    def to_json(self, **extra):
+        """The snapshot, plus any extra fields (labels, timestamps), as JSON."""
+        snapshot = self.snapshot()
+        snapshot.update(extra)
+        return json.dumps(snapshot)
+
+    def __repr__(self):
+        return f"SearchStats({self.snapshot()})"
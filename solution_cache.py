@@ -0,0 +1,139 @@
+import math
+import os
+import struct
+from collections import OrderedDict
+
+# Bounded LRU cache of solved sliding-puzzle states. Boards are keyed by
+# bytes(tiles), the flat row-major board. Each entry stores the optimal
+# distance to the goal and the next move on an optimal path (the direction
+# the blank moves: 'U', 'D', 'L' or 'R', as in prac2), so every state on a
+# recorded path can be answered by following next moves down to the goal.
+
+CACHE_MAGIC = b'SOLC'
+
+DIRECTIONS = {'U': (-1, 0), 'D': (1, 0), 'L': (0, -1), 'R': (0, 1)}
+
+
+def apply_move(board, move):
+    """Slide the blank of a flat board one cell in direction move, in place."""
+    size = math.isqrt(len(board))
+    blank = board.index(0)
+    row, col = divmod(blank, size)
+    dr, dc = DIRECTIONS[move]
+    target = (row + dr) * size + col + dc
+    board[blank], board[target] = board[target], 0
+
+
+class SolutionCache:
+    """LRU map from board to (optimal distance, next move), optionally persisted."""
+
+    def __init__(self, capacity=100000, path=None):
+        self.capacity = capacity
+        self.path = path
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.partial_hits = 0
+        self.evictions = 0
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def record(self, boards, moves):
+        """
+        Record an optimal path: boards from the start to the goal and the
+        moves between them. Every board on it learns its distance and next move.
+        """
+        depth = len(moves)
+        for i, board in enumerate(boards):
+            key = bytes(board)
+            distance = depth - i
+            known = self._entries.get(key)
+            if known is None or distance <= known[0]:
+                self._entries[key] = (distance, moves[i] if i < depth else '')
+            self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def lookup(self, board):
+        """Optimal moves from board to the goal, or None; counted as a hit or miss."""
+        moves = self._follow(board)
+        if moves is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return moves
+
+    def completion(self, board):
+        """
+        Like lookup, but for probes made during a search: only successful
+        probes are counted (as partial hits), so misses reflect queries.
+        """
+        moves = self._follow(board)
+        if moves is not None:
+            self.partial_hits += 1
+        return moves
+
+    def _follow(self, board):
+        """Walk next moves from board down to the goal, refreshing each entry."""
+        key = bytes(board)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        board = list(board)
+        moves = []
+        while entry[0] > 0:
+            self._entries.move_to_end(key)
+            distance, move = entry
+            moves.append(move)
+            apply_move(board, move)
+            key = bytes(board)
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != distance - 1:
+                return None  # Part of the path has been evicted
+        self._entries.move_to_end(key)
+        return moves
+
+    def stats(self):
+        """Counters as a dict."""
+        return {
+            'entries': len(self._entries),
+            'capacity': self.capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'partial_hits': self.partial_hits,
+            'evictions': self.evictions,
+        }
+
+    def save(self, path=None):
+        """Write the entries, least recently used first, to path."""
+        path = path or self.path
+        with open(path, 'wb') as f:
+            f.write(struct.pack('<4sI', CACHE_MAGIC, len(self._entries)))
+            for key, (distance, move) in self._entries.items():
+                f.write(struct.pack('<BHc', len(key), distance, (move or '-').encode()))
+                f.write(key)
+
+    def load(self, path):
+        """Add the entries saved in path, keeping their LRU order."""
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, count = struct.unpack_from('<4sI', data, 0)
+        if magic != CACHE_MAGIC:
+            raise ValueError(f"{path} is not a solution cache file")
+        offset = struct.calcsize('<4sI')
+        entry_size = struct.calcsize('<BHc')
+        for _ in range(count):
+            length, distance, move = struct.unpack_from('<BHc', data, offset)
+            offset += entry_size
+            key = data[offset:offset + length]
+            offset += length
+            move = move.decode()
+            self._entries[key] = (distance, '' if move == '-' else move)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
@@ -51,7 +51,10 @@ class TicTacToe:
         else:
             return 0
 
-def minimax_alpha_beta(game, depth, alpha, beta, maximizing_player):
+def minimax_alpha_beta(game, depth, alpha, beta, maximizing_player, stats=None):
+    # stats: optional search_stats.SearchStats; each call is one node
+    if stats is not None:
+        stats.expansions += 1
     if game.is_winner('X'):
         return 1
     if game.is_winner('O'):
@@ -62,43 +65,51 @@ def minimax_alpha_beta(game, depth, alpha, beta, maximizing_player):
         max_eval = float('-inf')
         for move in game.get_available_moves():
             game.make_move(move, 'X')
-            eval_score = minimax_alpha_beta(game, depth - 1, alpha, beta, False)
+            eval_score = minimax_alpha_beta(game, depth - 1, alpha, beta, False, stats)
             game.undo_move(move)         
             max_eval = max(max_eval, eval_score)
             alpha = max(alpha, eval_score)
             if beta <= alpha:
+                if stats is not None:
+                    stats.cutoffs += 1
                 break
         return max_eval
     else:
         min_eval = float('inf')
         for move in game.get_available_moves():
             game.make_move(move, 'O')
-            eval_score = minimax_alpha_beta(game, depth - 1, alpha, beta, True)
+            eval_score = minimax_alpha_beta(game, depth - 1, alpha, beta, True, stats)
             game.undo_move(move)
             min_eval = min(min_eval, eval_score)
             beta = min(beta, eval_score)
             if beta <= alpha:
+                if stats is not None:
+                    stats.cutoffs += 1
                 break
         
         return min_eval
 
-def get_best_move(game, player):
+def get_best_move(game, player, stats=None):
+    if stats is not None:
+        stats.mark()
     best_score = float('-inf') if player == 'X' else float('inf')
     best_move = None
     for move in game.get_available_moves():
         game.make_move(move, player)
         if player == 'X':
-            score = minimax_alpha_beta(game, 6, float('-inf'), float('inf'), False)  # Reduced depth for 5x5
+            score = minimax_alpha_beta(game, 6, float('-inf'), float('inf'), False, stats)  # Reduced depth for 5x5
             if score > best_score:
                 best_score = score
                 best_move = move
         else:
-            score = minimax_alpha_beta(game, 6, float('-inf'), float('inf'), True)  # Reduced depth for 5x5
+            score = minimax_alpha_beta(game, 6, float('-inf'), float('inf'), True, stats)  # Reduced depth for 5x5
             if score < best_score:
                 best_score = score
                 best_move = move
         
         game.undo_move(move)
+    if stats is not None:
+        stats.lap('search')
     return best_move
 
 def main():